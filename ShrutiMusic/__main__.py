@@ -6,9 +6,23 @@ from pytgcalls.exceptions import NoActiveGroupCall
 import config
 from NapsterMusicBot import LOGGER, app, userbot
 from NapsterMusicBot.core.call import Nand
+from ShrutiMusic.core.executor import cpu_pool, io_pool, watchdog
+from ShrutiMusic.core.http import http
+from ShrutiMusic.core.schema import ensure_indexes
 from NapsterMusicBot.misc import sudo
 from NapsterMusicBot.plugins import ALL_MODULES
 from NapsterMusicBot.utils.database import get_banned_users, get_gbanned
+from ShrutiMusic.utils.broadcast import resume_broadcasts
+from ShrutiMusic.utils.gban import resume_gbans
+from ShrutiMusic.utils.database import (
+    flush_plays,
+    flush_served,
+    load_served,
+    migrate_plays,
+    play_flusher,
+    served_flusher,
+)
+from ShrutiMusic.utils.stream.store import flush_queues, queue_saver, restore_queues
 from config import BANNED_USERS
 
 # Bot Commands List
@@ -55,17 +69,19 @@ async def setup_bot_commands():
         LOGGER("NapsterMusicBot").error(f"Failed to set bot commands: {str(e)}")
 
 async def init():
-    if (
-        not config.STRING1
-        and not config.STRING2
-        and not config.STRING3
-        and not config.STRING4
-        and not config.STRING5
-    ):
+    if not config.STRING_SESSIONS:
         LOGGER(__name__).error("Assistant client variables not defined, exiting...")
         exit()
 
+    asyncio.create_task(ensure_indexes())
     await sudo()
+    await load_served()
+    asyncio.create_task(served_flusher())
+    try:
+        await migrate_plays()
+    except Exception as e:
+        LOGGER("NapsterMusicBot").warning(f"Failed to migrate play stats: {e}")
+    asyncio.create_task(play_flusher())
 
     try:
         users = await get_gbanned()
@@ -99,6 +115,12 @@ async def init():
         pass
 
     await Nand.decorators()
+    asyncio.create_task(watchdog())
+    if config.QUEUE_PERSIST:
+        asyncio.create_task(restore_queues())
+        asyncio.create_task(queue_saver())
+    await resume_broadcasts()
+    await resume_gbans()
 
     LOGGER("NapsterMusicBot").info(
         "Napster Music Bot Started Successfully! 🎶\n\nDon’t forget to visit @NapsterMusic"
@@ -106,8 +128,24 @@ async def init():
 
     await idle()
 
+    if config.QUEUE_PERSIST:
+        try:
+            await flush_queues()
+        except Exception as e:
+            LOGGER("NapsterMusicBot").warning(f"Failed to save queues: {e}")
+    try:
+        await flush_served()
+    except Exception as e:
+        LOGGER("NapsterMusicBot").warning(f"Failed to save served users/chats: {e}")
+    try:
+        await flush_plays()
+    except Exception as e:
+        LOGGER("NapsterMusicBot").warning(f"Failed to save play stats: {e}")
     await app.stop()
     await userbot.stop()
+    await http.close()
+    io_pool.shutdown()
+    cpu_pool.shutdown()
     LOGGER("NapsterMusicBot").info("Stopping Napster Music Bot...🥺")
 
 if __name__ == "__main__":
@@ -21,11 +21,11 @@
 
 
 import asyncio
-import os
 from datetime import datetime, timedelta
 from typing import Union
 
 from pyrogram import Client
+from pyrogram.errors import FloodWait
 from pyrogram.types import InlineKeyboardMarkup
 from pytgcalls import PyTgCalls, StreamType
 from pytgcalls.exceptions import (
@@ -39,11 +39,12 @@ from pytgcalls.types.input_stream.quality import HighQualityAudio, MediumQuality
 from pytgcalls.types.stream import StreamAudioEnded
 
 import config
-from ShrutiMusic import LOGGER, YouTube, app
+from ShrutiMusic import LOGGER, Telegram, YouTube, app
 from ShrutiMusic.misc import db
 from ShrutiMusic.utils.database import (
     add_active_chat,
     add_active_video_chat,
+    add_pending_join,
     get_lang,
     get_loop,
     group_assistant,
@@ -51,13 +52,24 @@ from ShrutiMusic.utils.database import (
     music_on,
     remove_active_chat,
     remove_active_video_chat,
+    remove_pending_join,
+    report_floodwait,
     set_loop,
 )
 from ShrutiMusic.utils.exceptions import AssistantErr
-from ShrutiMusic.utils.formatters import check_duration, seconds_to_min, speed_converter
+from ShrutiMusic.utils.formatters import seconds_to_min
 from ShrutiMusic.utils.inline.play import stream_markup
 from ShrutiMusic.utils.stream.autoclear import auto_clean
+from ShrutiMusic.utils.stream.position import get_played, set_played, start_position
+from ShrutiMusic.utils.stream.prefetch import (
+    cancel_prefetch,
+    is_prefetched,
+    schedule_prefetch,
+)
+from ShrutiMusic.utils.stream.queue import Queue
+from ShrutiMusic.utils.stream.speed import render, rendered, tempo_parameters
 from ShrutiMusic.utils.thumbnails import gen_thumb
+from config import time_to_seconds
 from strings import get_string
 
 autoend = {}
@@ -65,63 +77,29 @@ counter = {}
 
 
 async def _clear_(chat_id):
-    db[chat_id] = []
+    cancel_prefetch(chat_id)
+    for popped in db.get(chat_id) or []:
+        await auto_clean(popped)
+    db[chat_id] = Queue()
     await remove_active_video_chat(chat_id)
     await remove_active_chat(chat_id)
 
 
 class Call(PyTgCalls):
     def __init__(self):
-        self.userbot1 = Client(
-            name="NandAss1",
-            api_id=config.API_ID,
-            api_hash=config.API_HASH,
-            session_string=str(config.STRING1),
-        )
-        self.one = PyTgCalls(
-            self.userbot1,
-            cache_duration=100,
-        )
-        self.userbot2 = Client(
-            name="NandAss2",
-            api_id=config.API_ID,
-            api_hash=config.API_HASH,
-            session_string=str(config.STRING2),
-        )
-        self.two = PyTgCalls(
-            self.userbot2,
-            cache_duration=100,
-        )
-        self.userbot3 = Client(
-            name="NandAss3",
-            api_id=config.API_ID,
-            api_hash=config.API_HASH,
-            session_string=str(config.STRING3),
-        )
-        self.three = PyTgCalls(
-            self.userbot3,
-            cache_duration=100,
-        )
-        self.userbot4 = Client(
-            name="NandAss4",
-            api_id=config.API_ID,
-            api_hash=config.API_HASH,
-            session_string=str(config.STRING4),
-        )
-        self.four = PyTgCalls(
-            self.userbot4,
-            cache_duration=100,
-        )
-        self.userbot5 = Client(
-            name="NandAss5",
-            api_id=config.API_ID,
-            api_hash=config.API_HASH,
-            session_string=str(config.STRING5),
-        )
-        self.five = PyTgCalls(
-            self.userbot5,
-            cache_duration=100,
-        )
+        self.userbots = {}
+        self.calls = {}
+        for number, session in sorted(config.STRING_SESSIONS.items()):
+            self.userbots[number] = Client(
+                name=f"NandAss{number}",
+                api_id=config.API_ID,
+                api_hash=config.API_HASH,
+                session_string=str(session),
+            )
+            self.calls[number] = PyTgCalls(
+                self.userbots[number],
+                cache_duration=100,
+            )
 
     async def pause_stream(self, chat_id: int):
         assistant = await group_assistant(self, chat_id)
@@ -140,31 +118,11 @@ class Call(PyTgCalls):
             pass
 
     async def stop_stream_force(self, chat_id: int):
-        try:
-            if config.STRING1:
-                await self.one.leave_group_call(chat_id)
-        except:
-            pass
-        try:
-            if config.STRING2:
-                await self.two.leave_group_call(chat_id)
-        except:
-            pass
-        try:
-            if config.STRING3:
-                await self.three.leave_group_call(chat_id)
-        except:
-            pass
-        try:
-            if config.STRING4:
-                await self.four.leave_group_call(chat_id)
-        except:
-            pass
-        try:
-            if config.STRING5:
-                await self.five.leave_group_call(chat_id)
-        except:
-            pass
+        for assistant in self.calls.values():
+            try:
+                await assistant.leave_group_call(chat_id)
+            except:
+                pass
         try:
             await _clear_(chat_id)
         except:
@@ -172,56 +130,35 @@ class Call(PyTgCalls):
 
     async def speedup_stream(self, chat_id: int, file_path, speed, playing):
         assistant = await group_assistant(self, chat_id)
-        if str(speed) != str("1.0"):
-            base = os.path.basename(file_path)
-            chatdir = os.path.join(os.getcwd(), "playback", str(speed))
-            if not os.path.isdir(chatdir):
-                os.makedirs(chatdir)
-            out = os.path.join(chatdir, base)
-            if not os.path.isfile(out):
-                if str(speed) == str("0.5"):
-                    vs = 2.0
-                if str(speed) == str("0.75"):
-                    vs = 1.35
-                if str(speed) == str("1.5"):
-                    vs = 0.68
-                if str(speed) == str("2.0"):
-                    vs = 0.5
-                proc = await asyncio.create_subprocess_shell(
-                    cmd=(
-                        "ffmpeg "
-                        "-i "
-                        f"{file_path} "
-                        "-filter:v "
-                        f"setpts={vs}*PTS "
-                        "-filter:a "
-                        f"atempo={speed} "
-                        f"{out}"
-                    ),
-                    stdin=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                await proc.communicate()
-            else:
-                pass
+        entry = playing[0]
+        rate = float(speed)
+        source = int(get_played(entry) * float(entry.get("speed") or 1.0))
+        total = int(entry.get("old_second") or entry["seconds"])
+        follow = Telegram.ffmpeg_parameters(file_path)
+        out = None
+        if rate == 1.0:
+            parameters = f"{follow} -ss {source}"
         else:
-            out = file_path
-        dur = await asyncio.get_event_loop().run_in_executor(None, check_duration, out)
-        dur = int(dur)
-        played, con_seconds = speed_converter(playing[0]["played"], speed)
-        duration = seconds_to_min(dur)
+            if not follow:
+                out = rendered(file_path, speed)
+            if out:
+                parameters = f"-ss {int(source / rate)}"
+            else:
+                parameters = tempo_parameters(speed, source, follow)
+                if config.SPEED_PRERENDER and not follow:
+                    render(file_path, speed)
         stream = (
             AudioVideoPiped(
-                out,
+                out or file_path,
                 audio_parameters=HighQualityAudio(),
                 video_parameters=MediumQualityVideo(),
-                additional_ffmpeg_parameters=f"-ss {played} -to {duration}",
+                additional_ffmpeg_parameters=parameters,
             )
-            if playing[0]["streamtype"] == "video"
+            if entry["streamtype"] == "video"
             else AudioPiped(
-                out,
+                out or file_path,
                 audio_parameters=HighQualityAudio(),
-                additional_ffmpeg_parameters=f"-ss {played} -to {duration}",
+                additional_ffmpeg_parameters=parameters,
             )
         )
         if str(db[chat_id][0]["file"]) == str(file_path):
@@ -229,21 +166,22 @@ class Call(PyTgCalls):
         else:
             raise AssistantErr("Umm")
         if str(db[chat_id][0]["file"]) == str(file_path):
-            exis = (playing[0]).get("old_dur")
-            if not exis:
-                db[chat_id][0]["old_dur"] = db[chat_id][0]["dur"]
-                db[chat_id][0]["old_second"] = db[chat_id][0]["seconds"]
-            db[chat_id][0]["played"] = con_seconds
-            db[chat_id][0]["dur"] = duration
-            db[chat_id][0]["seconds"] = dur
-            db[chat_id][0]["speed_path"] = out
-            db[chat_id][0]["speed"] = speed
+            if not entry.get("old_dur"):
+                entry["old_dur"] = entry["dur"]
+                entry["old_second"] = entry["seconds"]
+            dur = int(total / rate)
+            entry["dur"] = entry["old_dur"] if rate == 1.0 else seconds_to_min(dur)
+            entry["seconds"] = dur
+            entry["speed_path"] = out
+            entry["speed"] = speed
+            set_played(entry, int(source / rate))
 
     async def force_stop_stream(self, chat_id: int):
         assistant = await group_assistant(self, chat_id)
         try:
             check = db.get(chat_id)
-            check.pop(0)
+            popped = check.pop(0)
+            await auto_clean(popped)
         except:
             pass
         await remove_active_video_chat(chat_id)
@@ -261,33 +199,47 @@ class Call(PyTgCalls):
         image: Union[bool, str] = None,
     ):
         assistant = await group_assistant(self, chat_id)
+        parameters = Telegram.ffmpeg_parameters(link)
         if video:
             stream = AudioVideoPiped(
                 link,
                 audio_parameters=HighQualityAudio(),
                 video_parameters=MediumQualityVideo(),
+                additional_ffmpeg_parameters=parameters,
             )
         else:
-            stream = AudioPiped(link, audio_parameters=HighQualityAudio())
+            stream = AudioPiped(
+                link,
+                audio_parameters=HighQualityAudio(),
+                additional_ffmpeg_parameters=parameters,
+            )
         await assistant.change_stream(
             chat_id,
             stream,
         )
+        schedule_prefetch(chat_id)
 
-    async def seek_stream(self, chat_id, file_path, to_seek, duration, mode):
+    async def seek_stream(
+        self, chat_id, file_path, to_seek, duration, mode, speed=None
+    ):
         assistant = await group_assistant(self, chat_id)
+        follow = Telegram.ffmpeg_parameters(file_path)
+        parameters = f"{follow} -ss {to_seek} -to {duration}"
+        if speed and float(speed) != 1.0:
+            start = int(time_to_seconds(to_seek) * float(speed))
+            parameters = tempo_parameters(speed, start, follow)
         stream = (
             AudioVideoPiped(
                 file_path,
                 audio_parameters=HighQualityAudio(),
                 video_parameters=MediumQualityVideo(),
-                additional_ffmpeg_parameters=f"-ss {to_seek} -to {duration}",
+                additional_ffmpeg_parameters=parameters,
             )
             if mode == "video"
             else AudioPiped(
                 file_path,
                 audio_parameters=HighQualityAudio(),
-                additional_ffmpeg_parameters=f"-ss {to_seek} -to {duration}",
+                additional_ffmpeg_parameters=parameters,
             )
         )
         await assistant.change_stream(chat_id, stream)
@@ -313,11 +265,13 @@ class Call(PyTgCalls):
         assistant = await group_assistant(self, chat_id)
         language = await get_lang(chat_id)
         _ = get_string(language)
+        parameters = Telegram.ffmpeg_parameters(link)
         if video:
             stream = AudioVideoPiped(
                 link,
                 audio_parameters=HighQualityAudio(),
                 video_parameters=MediumQualityVideo(),
+                additional_ffmpeg_parameters=parameters,
             )
         else:
             stream = (
@@ -325,10 +279,16 @@ class Call(PyTgCalls):
                     link,
                     audio_parameters=HighQualityAudio(),
                     video_parameters=MediumQualityVideo(),
+                    additional_ffmpeg_parameters=parameters,
                 )
                 if video
-                else AudioPiped(link, audio_parameters=HighQualityAudio())
+                else AudioPiped(
+                    link,
+                    audio_parameters=HighQualityAudio(),
+                    additional_ffmpeg_parameters=parameters,
+                )
             )
+        await add_pending_join(chat_id)
         try:
             await assistant.join_group_call(
                 chat_id,
@@ -341,6 +301,11 @@ class Call(PyTgCalls):
             raise AssistantErr(_["call_9"])
         except TelegramServerError:
             raise AssistantErr(_["call_10"])
+        except FloodWait as e:
+            await report_floodwait(chat_id, e.value)
+            raise
+        finally:
+            await remove_pending_join(chat_id)
         await add_active_chat(chat_id)
         await music_on(chat_id)
         if video:
@@ -380,7 +345,7 @@ class Call(PyTgCalls):
             original_chat_id = check[0]["chat_id"]
             streamtype = check[0]["streamtype"]
             videoid = check[0]["vidid"]
-            db[chat_id][0]["played"] = 0
+            start_position(db[chat_id][0])
             exis = (check[0]).get("old_dur")
             if exis:
                 db[chat_id][0]["dur"] = exis
@@ -388,6 +353,7 @@ class Call(PyTgCalls):
                 db[chat_id][0]["speed_path"] = None
                 db[chat_id][0]["speed"] = 1.0
             video = True if str(streamtype) == "video" else False
+            schedule_prefetch(chat_id)
             if "live_" in queued:
                 n, link = await YouTube.video(videoid, True)
                 if n == 0:
@@ -429,7 +395,9 @@ class Call(PyTgCalls):
                 db[chat_id][0]["mystic"] = run
                 db[chat_id][0]["markup"] = "tg"
             elif "vid_" in queued:
-                mystic = await app.send_message(original_chat_id, _["call_7"])
+                mystic = None
+                if not is_prefetched(videoid, video):
+                    mystic = await app.send_message(original_chat_id, _["call_7"])
                 try:
                     file_path, direct = await YouTube.download(
                         videoid,
@@ -438,6 +406,8 @@ class Call(PyTgCalls):
                         video=True if str(streamtype) == "video" else False,
                     )
                 except:
+                    if not mystic:
+                        return await app.send_message(original_chat_id, _["call_6"])
                     return await mystic.edit_text(
                         _["call_6"], disable_web_page_preview=True
                     )
@@ -461,7 +431,8 @@ class Call(PyTgCalls):
                     )
                 img = await gen_thumb(videoid)
                 button = stream_markup(_, chat_id)
-                await mystic.delete()
+                if mystic:
+                    await mystic.delete()
                 run = await app.send_photo(
                     chat_id=original_chat_id,
                     photo=img,
@@ -502,16 +473,19 @@ class Call(PyTgCalls):
                 db[chat_id][0]["mystic"] = run
                 db[chat_id][0]["markup"] = "tg"
             else:
+                parameters = Telegram.ffmpeg_parameters(queued)
                 if video:
                     stream = AudioVideoPiped(
                         queued,
                         audio_parameters=HighQualityAudio(),
                         video_parameters=MediumQualityVideo(),
+                        additional_ffmpeg_parameters=parameters,
                     )
                 else:
                     stream = AudioPiped(
                         queued,
                         audio_parameters=HighQualityAudio(),
+                        additional_ffmpeg_parameters=parameters,
                     )
                 try:
                     await client.change_stream(chat_id, stream)
@@ -564,61 +538,30 @@ class Call(PyTgCalls):
                     db[chat_id][0]["markup"] = "stream"
 
     async def ping(self):
-        pings = []
-        if config.STRING1:
-            pings.append(await self.one.ping)
-        if config.STRING2:
-            pings.append(await self.two.ping)
-        if config.STRING3:
-            pings.append(await self.three.ping)
-        if config.STRING4:
-            pings.append(await self.four.ping)
-        if config.STRING5:
-            pings.append(await self.five.ping)
+        pings = await asyncio.gather(
+            *(assistant.ping for assistant in self.calls.values())
+        )
         return str(round(sum(pings) / len(pings), 3))
 
     async def start(self):
         LOGGER(__name__).info("Starting PyTgCalls Client...\n")
-        if config.STRING1:
-            await self.one.start()
-        if config.STRING2:
-            await self.two.start()
-        if config.STRING3:
-            await self.three.start()
-        if config.STRING4:
-            await self.four.start()
-        if config.STRING5:
-            await self.five.start()
+        await asyncio.gather(*(assistant.start() for assistant in self.calls.values()))
 
     async def decorators(self):
-        @self.one.on_kicked()
-        @self.two.on_kicked()
-        @self.three.on_kicked()
-        @self.four.on_kicked()
-        @self.five.on_kicked()
-        @self.one.on_closed_voice_chat()
-        @self.two.on_closed_voice_chat()
-        @self.three.on_closed_voice_chat()
-        @self.four.on_closed_voice_chat()
-        @self.five.on_closed_voice_chat()
-        @self.one.on_left()
-        @self.two.on_left()
-        @self.three.on_left()
-        @self.four.on_left()
-        @self.five.on_left()
         async def stream_services_handler(_, chat_id: int):
             await self.stop_stream(chat_id)
 
-        @self.one.on_stream_end()
-        @self.two.on_stream_end()
-        @self.three.on_stream_end()
-        @self.four.on_stream_end()
-        @self.five.on_stream_end()
         async def stream_end_handler1(client, update: Update):
             if not isinstance(update, StreamAudioEnded):
                 return
             await self.change_stream(client, update.chat_id)
 
+        for assistant in self.calls.values():
+            assistant.on_kicked()(stream_services_handler)
+            assistant.on_closed_voice_chat()(stream_services_handler)
+            assistant.on_left()(stream_services_handler)
+            assistant.on_stream_end()(stream_end_handler1)
+
 
 Nand = Call()
 
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+
+from ..logging import LOGGER
+
+
+class Pool:
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"Nand-{name}"
+        )
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait_time = 0.0
+        self.run_time = 0.0
+
+    def _call(self, queued_at: float, func, *args, **kwargs):
+        started = time.monotonic()
+        self.wait_time += started - queued_at
+        self.running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.running -= 1
+            self.run_time += time.monotonic() - started
+
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._call, time.monotonic(), func, *args, **kwargs)
+        self.pending += 1
+        try:
+            return await loop.run_in_executor(self.executor, call)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    def stats(self) -> dict:
+        done = self.completed or 1
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queued": max(self.pending - self.running, 0),
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait": round(self.wait_time / done, 3),
+            "avg_run": round(self.run_time / done, 3),
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+io_pool = Pool("io", config.IO_POOL_WORKERS)
+cpu_pool = Pool("cpu", config.CPU_POOL_WORKERS or os.cpu_count() or 1)
+
+
+async def watchdog(interval: float = 0.5):
+    loop = asyncio.get_running_loop()
+    threshold = config.LOOP_LAG_THRESHOLD / 1000
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = loop.time() - expected
+        if lag > threshold:
+            LOGGER(__name__).warning(
+                f"Event loop blocked for {int(lag * 1000)} ms "
+                f"(io: {io_pool.stats()}, cpu: {cpu_pool.stats()})"
+            )
+
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
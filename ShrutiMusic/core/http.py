@@ -0,0 +1,162 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+import config
+
+from ..logging import LOGGER
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF = 0.5
+
+
+class HTTPClient:
+    def __init__(self):
+        self._session = None
+        self._loop = None
+        self.requests = 0
+        self.retries = 0
+        self.created = 0
+        self.reused = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            self.requests += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self.created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.reused += 1
+
+        async def on_connection_queued_start(session, ctx, params):
+            ctx.queued_at = time.monotonic()
+
+        async def on_connection_queued_end(session, ctx, params):
+            self.waits += 1
+            self.wait_time += time.monotonic() - ctx.queued_at
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_connection_queued_start.append(on_connection_queued_start)
+        trace.on_connection_queued_end.append(on_connection_queued_end)
+        return trace
+
+    async def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=config.HTTP_POOL_LIMIT,
+                limit_per_host=config.HTTP_POOL_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=config.HTTP_TIMEOUT),
+                trace_configs=[self._trace_config()],
+            )
+            self._loop = loop
+            LOGGER(__name__).info("HTTP connection pool initialized.")
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, retries: int = None, **kwargs):
+        session = await self.session()
+        retries = config.HTTP_RETRIES if retries is None else retries
+        delay = RETRY_BACKOFF
+        attempt = 0
+        while True:
+            try:
+                response = await session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= retries:
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or attempt >= retries:
+                    break
+                response.release()
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+            delay *= 2
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> dict:
+        open_conns = 0
+        if self._session and not self._session.closed:
+            connector = self._session.connector
+            try:
+                open_conns = len(connector._acquired) + sum(
+                    len(conns) for conns in connector._conns.values()
+                )
+            except Exception:
+                pass
+        connections = self.created + self.reused
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "open": open_conns,
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_ratio": round(self.reused / connections, 3) if connections else 0.0,
+            "waits": self.waits,
+            "avg_wait": round(self.wait_time / self.waits, 4) if self.waits else 0.0,
+        }
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
+http = HTTPClient()
+
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
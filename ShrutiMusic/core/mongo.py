@@ -20,15 +20,61 @@
 # Email: badboy809075@gmail.com
 
 
+from collections import deque
+
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
 
-from config import MONGO_DB_URI
+from config import MONGO_DB_URI, MONGO_SLOW_QUERY
 
 from ..logging import LOGGER
 
+
+class QueryMonitor(monitoring.CommandListener):
+    def __init__(self):
+        self.pending = {}
+        self.latency = {}
+        self.slow = 0
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if isinstance(collection, str):
+            self.pending[event.request_id] = (event.command_name, collection)
+
+    def succeeded(self, event):
+        self.finish(event)
+
+    def failed(self, event):
+        self.finish(event)
+
+    def finish(self, event):
+        command = self.pending.pop(event.request_id, None)
+        if not command:
+            return
+        name, collection = command
+        took = event.duration_micros / 1000
+        samples = self.latency.get(collection)
+        if samples is None:
+            samples = self.latency[collection] = deque(maxlen=512)
+        samples.append(took)
+        if took >= MONGO_SLOW_QUERY:
+            self.slow += 1
+            LOGGER(__name__).warning(
+                f"Slow Mongo query: {name} on {collection} took {int(took)} ms"
+            )
+
+    def p95(self, collection: str):
+        samples = sorted(self.latency.get(collection) or ())
+        if not samples:
+            return None
+        return round(samples[min(int(len(samples) * 0.95), len(samples) - 1)], 2)
+
+
+monitor = QueryMonitor()
+
 LOGGER(__name__).info("Connecting to your Mongo Database...")
 try:
-    _mongo_async_ = AsyncIOMotorClient(MONGO_DB_URI)
+    _mongo_async_ = AsyncIOMotorClient(MONGO_DB_URI, event_listeners=[monitor])
     mongodb = _mongo_async_.Yukki
     LOGGER(__name__).info("Connected to your Mongo Database.")
 except:
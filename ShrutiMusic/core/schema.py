@@ -0,0 +1,132 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+
+import asyncio
+
+from pymongo.errors import OperationFailure
+
+from ShrutiMusic.core.mongo import mongodb, monitor
+from ShrutiMusic.logging import LOGGER
+
+INDEXES = {
+    "adminauth": ["chat_id"],
+    "assistants": ["chat_id"],
+    "authuser": ["chat_id"],
+    "autoend": ["chat_id"],
+    "autoleave": ["chat_id"],
+    "blacklistChat": ["chat_id"],
+    "blockedusers": ["user_id"],
+    "Champuvideocalls": ["chat_id"],
+    "chats": ["chat_id"],
+    "chatstats": ["chat_id"],
+    "cplaymode": ["chat_id"],
+    "filters": ["chat_id"],
+    "gban": ["user_id"],
+    "language": ["chat_id"],
+    "notes": ["chat_id"],
+    "onoffper": ["on_off"],
+    "playlist": ["chat_id"],
+    "playmode": ["chat_id"],
+    "playstats": [("scope", "id", "vidid")],
+    "playtypedb": ["chat_id"],
+    "privatechats": ["chat_id"],
+    "queries": ["chat_id"],
+    "seen": [("user_id", "chat_id")],
+    "skipmode": ["chat_id"],
+    "sudoers": ["sudo"],
+    "tgusersdb": ["user_id"],
+    "upcount": ["chat_id"],
+    "userstats": ["chat_id"],
+    "warns": ["chat_id"],
+}
+
+TTL_INDEXES = {
+    "searchcache": "expires",
+}
+
+
+async def _ensure(name: str, key):
+    collection = mongodb[name]
+    fields = key if isinstance(key, tuple) else (key,)
+    spec = [(field, 1) for field in fields]
+    label = "_".join(fields)
+    try:
+        await collection.create_index(spec, unique=True, name=f"{label}_unique")
+    except OperationFailure as e:
+        if e.code != 11000:
+            raise
+        LOGGER(__name__).warning(
+            f"Duplicate {label} values in {name}, creating a non-unique index instead."
+        )
+        await collection.create_index(spec, name=f"{label}_lookup")
+
+
+async def _ensure_ttl(name: str, key: str):
+    await mongodb[name].create_index(key, expireAfterSeconds=0, name=f"{key}_ttl")
+
+
+async def ensure_indexes():
+    results = await asyncio.gather(
+        *(
+            _ensure(name, key)
+            for name, keys in INDEXES.items()
+            for key in keys
+        ),
+        *(_ensure_ttl(name, key) for name, key in TTL_INDEXES.items()),
+        return_exceptions=True,
+    )
+    failed = [result for result in results if isinstance(result, Exception)]
+    for error in failed:
+        LOGGER(__name__).warning(f"Failed to create index: {error}")
+    LOGGER(__name__).info(
+        f"Ensured {len(results) - len(failed)} Mongo indexes."
+    )
+
+
+async def _collection_stats(name: str) -> dict:
+    collection = mongodb[name]
+    count = await collection.estimated_document_count()
+    usage = {}
+    try:
+        async for index in collection.aggregate([{"$indexStats": {}}]):
+            usage[index["name"]] = index["accesses"]["ops"]
+    except OperationFailure:
+        pass
+    return {"count": count, "indexes": usage, "p95": monitor.p95(name)}
+
+
+async def get_db_stats() -> dict:
+    names = sorted(await mongodb.list_collection_names())
+    stats = await asyncio.gather(*(_collection_stats(name) for name in names))
+    return dict(zip(names, stats))
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -23,9 +23,10 @@
 import re
 from typing import Union
 
-import aiohttp
 from bs4 import BeautifulSoup
-from youtubesearchpython.__future__ import VideosSearch
+
+from ShrutiMusic.core.http import http
+from ShrutiMusic.utils.searchcache import search_videos
 
 
 class RessoAPI:
@@ -42,11 +43,10 @@ class RessoAPI:
     async def track(self, url, playid: Union[bool, str] = None):
         if playid:
             url = self.base + url
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return False
-                html = await response.text()
+        async with http.get(url) as response:
+            if response.status != 200:
+                return False
+            html = await response.text()
         soup = BeautifulSoup(html, "html.parser")
         for tag in soup.find_all("meta"):
             if tag.get("property", None) == "og:title":
@@ -59,8 +59,7 @@ class RessoAPI:
                     pass
         if des == "":
             return
-        results = VideosSearch(title, limit=1)
-        for result in (await results.next())["result"]:
+        for result in await search_videos(title):
             title = result["title"]
             ytlink = result["link"]
             vidid = result["id"]
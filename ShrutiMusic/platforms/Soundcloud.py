@@ -24,6 +24,7 @@ from os import path
 
 from yt_dlp import YoutubeDL
 
+from ShrutiMusic.core.executor import io_pool
 from ShrutiMusic.utils.formatters import seconds_to_min
 
 
@@ -46,7 +47,7 @@ class SoundAPI:
     async def download(self, url):
         d = YoutubeDL(self.opts)
         try:
-            info = d.extract_info(url)
+            info = await io_pool.run(d.extract_info, url)
         except:
             return False
         xyz = path.join("downloads", f"{info['id']}.{info['ext']}")
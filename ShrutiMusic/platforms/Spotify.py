@@ -24,9 +24,10 @@ import re
 
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
-from youtubesearchpython.__future__ import VideosSearch
 
 import config
+from ShrutiMusic.core.executor import io_pool
+from ShrutiMusic.utils.searchcache import search_videos
 
 
 class SpotifyAPI:
@@ -51,14 +52,13 @@ class SpotifyAPI:
             return False
 
     async def track(self, link: str):
-        track = self.spotify.track(link)
+        track = await io_pool.run(self.spotify.track, link)
         info = track["name"]
         for artist in track["artists"]:
             fetched = f' {artist["name"]}'
             if "Various Artists" not in fetched:
                 info += fetched
-        results = VideosSearch(info, limit=1)
-        for result in (await results.next())["result"]:
+        for result in await search_videos(info):
             ytlink = result["link"]
             title = result["title"]
             vidid = result["id"]
@@ -74,7 +74,7 @@ class SpotifyAPI:
         return track_details, vidid
 
     async def playlist(self, url):
-        playlist = self.spotify.playlist(url)
+        playlist = await io_pool.run(self.spotify.playlist, url)
         playlist_id = playlist["id"]
         results = []
         for item in playlist["tracks"]["items"]:
@@ -88,7 +88,7 @@ class SpotifyAPI:
         return results, playlist_id
 
     async def album(self, url):
-        album = self.spotify.album(url)
+        album = await io_pool.run(self.spotify.album, url)
         album_id = album["id"]
         results = []
         for item in album["tracks"]["items"]:
@@ -105,10 +105,10 @@ class SpotifyAPI:
         )
 
     async def artist(self, url):
-        artistinfo = self.spotify.artist(url)
+        artistinfo = await io_pool.run(self.spotify.artist, url)
         artist_id = artistinfo["id"]
         results = []
-        artisttoptracks = self.spotify.artist_top_tracks(url)
+        artisttoptracks = await io_pool.run(self.spotify.artist_top_tracks, url)
         for item in artisttoptracks["tracks"]:
             info = item["name"]
             for artist in item["artists"]:
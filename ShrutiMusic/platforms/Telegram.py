@@ -29,18 +29,21 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Voice
 
 import config
 from ShrutiMusic import app
+from ShrutiMusic.core.executor import io_pool
 from ShrutiMusic.utils.formatters import (
     check_duration,
     convert_bytes,
     get_readable_time,
     seconds_to_min,
 )
+from ShrutiMusic.utils.stream.mediacache import media_cache
 
 
 class TeleAPI:
     def __init__(self):
         self.chars_limit = 4096
         self.sleep = 5
+        self.downloads = {}
 
     async def send_split_text(self, message, string):
         n = self.chars_limit
@@ -76,9 +79,7 @@ class TeleAPI:
             dur = seconds_to_min(filex.duration)
         except:
             try:
-                dur = await asyncio.get_event_loop().run_in_executor(
-                    None, check_duration, file_path
-                )
+                dur = await io_pool.run(check_duration, file_path)
                 dur = seconds_to_min(dur)
             except:
                 return "Unknown"
@@ -102,7 +103,7 @@ class TeleAPI:
                 )
             except:
                 file_name = audio.file_unique_id + "." + "ogg"
-            file_name = os.path.join(os.path.realpath("downloads"), file_name)
+            file_name = os.path.join("downloads", file_name)
         if video:
             try:
                 file_name = (
@@ -110,91 +111,148 @@ class TeleAPI:
                 )
             except:
                 file_name = video.file_unique_id + "." + "mp4"
-            file_name = os.path.join(os.path.realpath("downloads"), file_name)
+            file_name = os.path.join("downloads", file_name)
         return file_name
 
+    def downloading(self, path) -> bool:
+        fetch = self.downloads.get(str(path))
+        return fetch is not None and not fetch["task"].done()
+
+    def ffmpeg_parameters(self, path) -> str:
+        if not self.downloading(path):
+            return ""
+        return f"-follow 1 -rw_timeout {config.TG_STREAM_TIMEOUT * 1000000}"
+
+    async def playable(self, path) -> bool:
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "stream=codec_type",
+            "-of",
+            "csv=p=0",
+            path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        out, _ = await proc.communicate()
+        return proc.returncode == 0 and bool(out.strip())
+
+    async def fetch(self, media, fname, progress, ready):
+        marker = f"{fname}.part"
+        buffer = config.TG_STREAM_BUFFER * 1024 * 1024
+        written = 0
+        probed = 0
+        try:
+            open(marker, "w").close()
+            with open(fname, "wb") as file:
+                async for chunk in app.stream_media(media):
+                    await io_pool.run(file.write, chunk)
+                    await io_pool.run(file.flush)
+                    written += len(chunk)
+                    if ready.is_set():
+                        continue
+                    await progress(written)
+                    if written - probed >= buffer:
+                        probed = written
+                        if await self.playable(fname):
+                            ready.set()
+            os.remove(marker)
+            media_cache.add(fname)
+        except BaseException:
+            for path in (fname, marker):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            raise
+        finally:
+            ready.set()
+            self.downloads.pop(fname, None)
+
     async def download(self, _, message, mystic, fname):
-        lower = [0, 8, 17, 38, 64, 77, 96]
-        higher = [5, 10, 20, 40, 66, 80, 99]
-        checker = [5, 10, 20, 40, 66, 80, 99]
-        speed_counter = {}
-        if os.path.exists(fname):
+        if os.path.exists(f"{fname}.part") and not self.downloading(fname):
+            for path in (fname, f"{fname}.part"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        if os.path.exists(fname) and not self.downloading(fname):
+            if not media_cache.lookup(fname):
+                media_cache.add(fname)
             return True
+        media = message.reply_to_message
+        total = getattr(media, media.media.value).file_size if media.media else 0
+        started = time.time()
+        edited = 0
+        upl = InlineKeyboardMarkup(
+            [
+                [
+                    InlineKeyboardButton(
+                        text="ᴄᴀɴᴄᴇʟ",
+                        callback_data="stop_downloading",
+                    ),
+                ]
+            ]
+        )
 
-        async def down_load():
-            async def progress(current, total):
-                if current == total:
-                    return
-                current_time = time.time()
-                start_time = speed_counter.get(message.id)
-                check_time = current_time - start_time
-                upl = InlineKeyboardMarkup(
-                    [
-                        [
-                            InlineKeyboardButton(
-                                text="ᴄᴀɴᴄᴇʟ",
-                                callback_data="stop_downloading",
-                            ),
-                        ]
-                    ]
-                )
-                percentage = current * 100 / total
-                percentage = str(round(percentage, 2))
-                speed = current / check_time
-                eta = int((total - current) / speed)
-                eta = get_readable_time(eta)
-                if not eta:
-                    eta = "0 sᴇᴄᴏɴᴅs"
-                total_size = convert_bytes(total)
-                completed_size = convert_bytes(current)
-                speed = convert_bytes(speed)
-                percentage = int((percentage.split("."))[0])
-                for counter in range(7):
-                    low = int(lower[counter])
-                    high = int(higher[counter])
-                    check = int(checker[counter])
-                    if low < percentage <= high:
-                        if high == check:
-                            try:
-                                await mystic.edit_text(
-                                    text=_["tg_1"].format(
-                                        app.mention,
-                                        total_size,
-                                        completed_size,
-                                        percentage[:5],
-                                        speed,
-                                        eta,
-                                    ),
-                                    reply_markup=upl,
-                                )
-                                checker[counter] = 100
-                            except:
-                                pass
-
-            speed_counter[message.id] = time.time()
+        async def progress(current):
+            nonlocal edited
+            now = time.time()
+            if not total or now - edited < self.sleep:
+                return
+            edited = now
+            speed = current / max(now - started, 1)
+            eta = get_readable_time(int((total - current) / speed)) or "0 sᴇᴄᴏɴᴅs"
             try:
-                await app.download_media(
-                    message.reply_to_message,
-                    file_name=fname,
-                    progress=progress,
+                await mystic.edit_text(
+                    text=_["tg_1"].format(
+                        app.mention,
+                        convert_bytes(total),
+                        convert_bytes(current),
+                        int(current * 100 / total),
+                        convert_bytes(speed),
+                        eta,
+                    ),
+                    reply_markup=upl,
                 )
-                try:
-                    elapsed = get_readable_time(
-                        int(int(time.time()) - int(speed_counter[message.id]))
-                    )
-                except:
-                    elapsed = "0 sᴇᴄᴏɴᴅs"
-                await mystic.edit_text(_["tg_2"].format(elapsed))
             except:
-                await mystic.edit_text(_["tg_3"])
+                pass
+
+        fetch = self.downloads.get(fname)
+        if not fetch:
+            ready = asyncio.Event()
+            fetch = self.downloads[fname] = {
+                "ready": ready,
+                "task": asyncio.create_task(
+                    self.fetch(media, fname, progress, ready)
+                ),
+            }
 
-        task = asyncio.create_task(down_load())
+        async def buffered():
+            try:
+                await fetch["ready"].wait()
+            except asyncio.CancelledError:
+                if not fetch["ready"].is_set():
+                    fetch["task"].cancel()
+                raise
+
+        task = asyncio.create_task(buffered())
         config.lyrical[mystic.id] = task
-        await task
-        verify = config.lyrical.get(mystic.id)
-        if not verify:
+        try:
+            await task
+        except asyncio.CancelledError:
+            return False
+        finally:
+            config.lyrical.pop(mystic.id, None)
+        task = fetch["task"]
+        failed = task.done() and (task.cancelled() or task.exception())
+        if failed or not os.path.exists(fname):
+            await mystic.edit_text(_["tg_3"])
             return False
-        config.lyrical.pop(mystic.id)
+        elapsed = get_readable_time(int(time.time() - started)) or "0 sᴇᴄᴏɴᴅs"
+        await mystic.edit_text(_["tg_2"].format(elapsed))
         return True
 
 
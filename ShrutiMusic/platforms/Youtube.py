@@ -2,15 +2,16 @@ import asyncio
 import os
 import re
 import json
+import time
 from typing import Union
 import requests
 import yt_dlp
 from pyrogram.enums import MessageEntityType
 from pyrogram.types import Message
-from youtubesearchpython.__future__ import VideosSearch
 from ShrutiMusic.utils.database import is_on_off
 from ShrutiMusic import app
 from ShrutiMusic.utils.formatters import time_to_seconds
+from ShrutiMusic.utils.stream.mediacache import media_cache
 import os
 import glob
 import random
@@ -21,6 +22,9 @@ import aiohttp
 import config
 import traceback
 from ShrutiMusic import LOGGER
+from ShrutiMusic.core.executor import io_pool
+from ShrutiMusic.core.http import http
+from ShrutiMusic.utils.searchcache import search_videos
 
 YOUR_API_URL = None
 
@@ -39,14 +43,13 @@ async def load_api_url():
     logger = LOGGER("ShrutiMusic/platforms/Youtube.py")
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://pastebin.com/raw/rLsBhAQa") as response:
-                if response.status == 200:
-                    content = await response.text()
-                    YOUR_API_URL = content.strip()
-                    logger.info(f"API URL loaded successfully")
-                else:
-                    logger.error(f"Failed to fetch API URL. HTTP Status: {response.status}")
+        async with http.get("https://pastebin.com/raw/rLsBhAQa") as response:
+            if response.status == 200:
+                content = await response.text()
+                YOUR_API_URL = content.strip()
+                logger.info(f"API URL loaded successfully")
+            else:
+                logger.error(f"Failed to fetch API URL. HTTP Status: {response.status}")
     except Exception as e:
         logger.error(f"Error loading API URL: {e}")
 
@@ -59,7 +62,107 @@ try:
 except RuntimeError:
     pass
 
-async def download_song(link: str) -> str:
+_download_tasks = {}
+_download_waiters = {}
+_throttled = set()
+_slider_sessions = {}
+
+
+class _Bandwidth:
+    def __init__(self, rate: int):
+        self.rate = rate
+        self.allowance = rate
+        self.stamp = time.monotonic()
+
+    async def consume(self, amount: int):
+        if not self.rate:
+            return
+        now = time.monotonic()
+        self.allowance = min(self.rate, self.allowance + (now - self.stamp) * self.rate)
+        self.stamp = now
+        self.allowance -= amount
+        if self.allowance < 0:
+            await asyncio.sleep(-self.allowance / self.rate)
+
+
+_prefetch_bandwidth = _Bandwidth(config.PREFETCH_BANDWIDTH)
+
+
+async def _single_flight(file_path: str, fetch, *args) -> str:
+    task = _download_tasks.get(file_path)
+    if task is None:
+        task = asyncio.ensure_future(fetch(*args))
+        _download_tasks[file_path] = task
+        task.add_done_callback(lambda _: _download_tasks.pop(file_path, None))
+    _download_waiters[file_path] = _download_waiters.get(file_path, 0) + 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        _download_waiters[file_path] -= 1
+        if not _download_waiters[file_path]:
+            del _download_waiters[file_path]
+            if not task.done():
+                task.cancel()
+
+
+async def _fetch_media(video_id: str, file_path: str, media_type: str, timeout: int) -> str:
+    tag = media_type.upper()
+    logger = LOGGER("ShrutiMusic/platforms/Youtube.py")
+    temp_path = f"{file_path}.part"
+
+    try:
+        params = {"url": video_id, "type": media_type}
+        
+        async with http.get(
+            f"{YOUR_API_URL}/download",
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            data = await response.json()
+
+            if response.status != 200:
+                logger.error(f"[{tag}] API error: {response.status}")
+                return None
+
+            if data.get("status") != "success" or not data.get("stream_url"):
+                logger.error(f"[{tag}] Invalid response: {data}")
+                return None
+
+            stream_url = data["stream_url"]
+            logger.info(f"[{tag}] Stream URL obtained: {video_id}")
+            
+        async with http.get(
+            stream_url,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as file_response:
+            if file_response.status != 200:
+                logger.error(f"[{tag}] Download failed: {file_response.status}")
+                return None
+                
+            with open(temp_path, "wb") as f:
+                async for chunk in file_response.content.iter_chunked(16384):
+                    f.write(chunk)
+                    if file_path in _throttled:
+                        await _prefetch_bandwidth.consume(len(chunk))
+            os.replace(temp_path, file_path)
+            
+            media_cache.add(file_path)
+            logger.info(f"🎉 [{tag}] Downloaded: {video_id}")
+            return file_path
+
+    except asyncio.TimeoutError:
+        logger.error(f"[{tag}] Timeout: {video_id}")
+        return None
+    except Exception as e:
+        logger.error(f"[{tag}] Exception: {video_id} - {e}")
+        return None
+    finally:
+        _throttled.discard(file_path)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+async def download_song(link: str, prefetch: bool = False) -> str:
     global YOUR_API_URL
     
     if not YOUR_API_URL:
@@ -80,56 +183,18 @@ async def download_song(link: str) -> str:
     os.makedirs(DOWNLOAD_DIR, exist_ok=True)
     file_path = os.path.join(DOWNLOAD_DIR, f"{video_id}.webm")
 
-    if os.path.exists(file_path):
-        logger.info(f"🎵 [LOCAL] File exists: {video_id}")
+    if media_cache.lookup(file_path):
+        logger.info(f"🎵 [CACHE] Hit: {video_id}")
         return file_path
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            params = {"url": video_id, "type": "audio"}
-            
-            async with session.get(
-                f"{YOUR_API_URL}/download",
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=60)
-            ) as response:
-                data = await response.json()
-
-                if response.status != 200:
-                    logger.error(f"[AUDIO] API error: {response.status}")
-                    return None
-
-                if data.get("status") != "success" or not data.get("stream_url"):
-                    logger.error(f"[AUDIO] Invalid response: {data}")
-                    return None
-
-                stream_url = data["stream_url"]
-                logger.info(f"[AUDIO] Stream URL obtained: {video_id}")
-                
-            async with session.get(
-                stream_url,
-                timeout=aiohttp.ClientTimeout(total=300)
-            ) as file_response:
-                if file_response.status != 200:
-                    logger.error(f"[AUDIO] Download failed: {file_response.status}")
-                    return None
-                    
-                with open(file_path, "wb") as f:
-                    async for chunk in file_response.content.iter_chunked(16384):
-                        f.write(chunk)
-                
-                logger.info(f"🎉 [AUDIO] Downloaded: {video_id}")
-                return file_path
-
-    except asyncio.TimeoutError:
-        logger.error(f"[AUDIO] Timeout: {video_id}")
-        return None
-    except Exception as e:
-        logger.error(f"[AUDIO] Exception: {video_id} - {e}")
-        return None
+    if not prefetch:
+        _throttled.discard(file_path)
+    elif file_path not in _download_tasks:
+        _throttled.add(file_path)
+    return await _single_flight(file_path, _fetch_media, video_id, file_path, "audio", 300)
 
 
-async def download_video(link: str) -> str:
+async def download_video(link: str, prefetch: bool = False) -> str:
     global YOUR_API_URL
     
     if not YOUR_API_URL:
@@ -150,53 +215,15 @@ async def download_video(link: str) -> str:
     os.makedirs(DOWNLOAD_DIR, exist_ok=True)
     file_path = os.path.join(DOWNLOAD_DIR, f"{video_id}.mkv")
 
-    if os.path.exists(file_path):
-        logger.info(f"🎥 [LOCAL] File exists: {video_id}")
+    if media_cache.lookup(file_path):
+        logger.info(f"🎥 [CACHE] Hit: {video_id}")
         return file_path
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            params = {"url": video_id, "type": "video"}
-            
-            async with session.get(
-                f"{YOUR_API_URL}/download",
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=60)
-            ) as response:
-                data = await response.json()
-
-                if response.status != 200:
-                    logger.error(f"[VIDEO] API error: {response.status}")
-                    return None
-
-                if data.get("status") != "success" or not data.get("stream_url"):
-                    logger.error(f"[VIDEO] Invalid response: {data}")
-                    return None
-
-                stream_url = data["stream_url"]
-                logger.info(f"[VIDEO] Stream URL obtained: {video_id}")
-                
-            async with session.get(
-                stream_url,
-                timeout=aiohttp.ClientTimeout(total=600)
-            ) as file_response:
-                if file_response.status != 200:
-                    logger.error(f"[VIDEO] Download failed: {file_response.status}")
-                    return None
-                    
-                with open(file_path, "wb") as f:
-                    async for chunk in file_response.content.iter_chunked(16384):
-                        f.write(chunk)
-                
-                logger.info(f"🎉 [VIDEO] Downloaded: {video_id}")
-                return file_path
-
-    except asyncio.TimeoutError:
-        logger.error(f"[VIDEO] Timeout: {video_id}")
-        return None
-    except Exception as e:
-        logger.error(f"[VIDEO] Exception: {video_id} - {e}")
-        return None
+    if not prefetch:
+        _throttled.discard(file_path)
+    elif file_path not in _download_tasks:
+        _throttled.add(file_path)
+    return await _single_flight(file_path, _fetch_media, video_id, file_path, "video", 600)
 
 async def check_file_size(link):
     async def get_format_info(link):
@@ -287,8 +314,7 @@ class YouTubeAPI:
             link = self.base + link
         if "&" in link:
             link = link.split("&")[0]
-        results = VideosSearch(link, limit=1)
-        for result in (await results.next())["result"]:
+        for result in await search_videos(link):
             title = result["title"]
             duration_min = result["duration"]
             thumbnail = result["thumbnails"][0]["url"].split("?")[0]
@@ -301,8 +327,7 @@ class YouTubeAPI:
             link = self.base + link
         if "&" in link:
             link = link.split("&")[0]
-        results = VideosSearch(link, limit=1)
-        for result in (await results.next())["result"]:
+        for result in await search_videos(link):
             return result["title"]
 
     async def duration(self, link: str, videoid: Union[bool, str] = None):
@@ -310,8 +335,7 @@ class YouTubeAPI:
             link = self.base + link
         if "&" in link:
             link = link.split("&")[0]
-        results = VideosSearch(link, limit=1)
-        for result in (await results.next())["result"]:
+        for result in await search_videos(link):
             return result["duration"]
 
     async def thumbnail(self, link: str, videoid: Union[bool, str] = None):
@@ -319,8 +343,7 @@ class YouTubeAPI:
             link = self.base + link
         if "&" in link:
             link = link.split("&")[0]
-        results = VideosSearch(link, limit=1)
-        for result in (await results.next())["result"]:
+        for result in await search_videos(link):
             return result["thumbnails"][0]["url"].split("?")[0]
 
     async def video(self, link: str, videoid: Union[bool, str] = None):
@@ -359,8 +382,7 @@ class YouTubeAPI:
             link = self.base + link
         if "&" in link:
             link = link.split("&")[0]
-        results = VideosSearch(link, limit=1)
-        for result in (await results.next())["result"]:
+        for result in await search_videos(link):
             title = result["title"]
             duration_min = result["duration"]
             vidid = result["id"]
@@ -387,7 +409,7 @@ class YouTubeAPI:
         ydl = yt_dlp.YoutubeDL(ytdl_opts)
         with ydl:
             formats_available = []
-            r = ydl.extract_info(link, download=False)
+            r = await io_pool.run(ydl.extract_info, link, download=False)
             for format in r["formats"]:
                 try:
                     if "dash" not in str(format["format"]).lower():
@@ -405,17 +427,31 @@ class YouTubeAPI:
                     continue
         return formats_available, link
 
-    async def slider(self, link: str, query_type: int, videoid: Union[bool, str] = None):
+    async def slider(
+        self,
+        link: str,
+        query_type: int,
+        videoid: Union[bool, str] = None,
+        user_id: int = None,
+    ):
         if videoid:
             link = self.base + link
         if "&" in link:
             link = link.split("&")[0]
-        a = VideosSearch(link, limit=10)
-        result = (await a.next()).get("result")
-        title = result[query_type]["title"]
-        duration_min = result[query_type]["duration"]
-        vidid = result[query_type]["id"]
-        thumbnail = result[query_type]["thumbnails"][0]["url"].split("?")[0]
+        now = time.monotonic()
+        session = _slider_sessions.get((link, user_id))
+        if session and session[0] > now:
+            result = session[1]
+        else:
+            result = await search_videos(link, limit=10)
+            for key in [k for k, v in _slider_sessions.items() if v[0] <= now]:
+                del _slider_sessions[key]
+            _slider_sessions[(link, user_id)] = (now + config.SLIDER_SESSION_TTL, result)
+        result = result[query_type % len(result)]
+        title = result["title"]
+        duration_min = result["duration"]
+        vidid = result["id"]
+        thumbnail = result["thumbnails"][0]["url"].split("?")[0]
         return title, duration_min, thumbnail, vidid
 
     async def download(
@@ -428,6 +464,7 @@ class YouTubeAPI:
         songvideo: Union[bool, str] = None,
         format_id: Union[bool, str] = None,
         title: Union[bool, str] = None,
+        prefetch: bool = False,
     ) -> str:
         if videoid:
             link = self.base + link
@@ -440,13 +477,13 @@ class YouTubeAPI:
                 else:
                     return None, False
             elif video:
-                downloaded_file = await download_video(link)
+                downloaded_file = await download_video(link, prefetch)
                 if downloaded_file:
                     return downloaded_file, True
                 else:
                     return None, False
             else:
-                downloaded_file = await download_song(link)
+                downloaded_file = await download_song(link, prefetch)
                 if downloaded_file:
                     return downloaded_file, True
                 else:
@@ -44,6 +44,12 @@ from ShrutiMusic.utils.formatters import seconds_to_min
 from ShrutiMusic.utils.inline import close_markup, stream_markup, stream_markup_timer
 from ShrutiMusic.utils.inline.help import help_pannel_page1, help_pannel_page2, help_pannel_page3, help_pannel_page4
 from ShrutiMusic.utils.stream.autoclear import auto_clean
+from ShrutiMusic.utils.stream.position import (
+    get_played,
+    pause_position,
+    resume_position,
+    start_position,
+)
 from ShrutiMusic.utils.thumbnails import gen_thumb
 from config import (
     BANNED_USERS,
@@ -359,6 +365,8 @@ async def del_back_playlist(client, CallbackQuery, _):
         await CallbackQuery.answer()
         await music_off(chat_id)
         await Nand.pause_stream(chat_id)
+        if db.get(chat_id):
+            pause_position(db[chat_id][0])
         await CallbackQuery.message.reply_text(
             _["admin_2"].format(mention), reply_markup=close_markup(_)
         )
@@ -369,6 +377,8 @@ async def del_back_playlist(client, CallbackQuery, _):
         await CallbackQuery.answer()
         await music_on(chat_id)
         await Nand.resume_stream(chat_id)
+        if db.get(chat_id):
+            resume_position(db[chat_id][0])
         await CallbackQuery.message.reply_text(
             _["admin_4"].format(mention), reply_markup=close_markup(_)
         )
@@ -438,7 +448,7 @@ async def del_back_playlist(client, CallbackQuery, _):
         videoid = check[0]["vidid"]
         status = True if str(streamtype) == "video" else None
         
-        db[chat_id][0]["played"] = 0
+        start_position(db[chat_id][0])
         exis = (check[0]).get("old_dur")
         if exis:
             db[chat_id][0]["dur"] = exis
@@ -632,7 +642,7 @@ async def markup_timer():
                         buttons = stream_markup_timer(
                             _,
                             chat_id,
-                            seconds_to_min(playing[0]["played"]),
+                            seconds_to_min(get_played(playing[0])),
                             playing[0]["dur"],
                         )
                         await mystic.edit_reply_markup(
@@ -25,9 +25,11 @@ from pyrogram.types import Message
 
 from ShrutiMusic import app
 from ShrutiMusic.core.call import Nand
+from ShrutiMusic.misc import db
 from ShrutiMusic.utils.database import is_music_playing, music_on
 from ShrutiMusic.utils.decorators import AdminRightsCheck
 from ShrutiMusic.utils.inline import close_markup
+from ShrutiMusic.utils.stream.position import resume_position
 from config import BANNED_USERS
 
 
@@ -38,6 +40,8 @@ async def resume_com(cli, message: Message, _, chat_id):
         return await message.reply_text(_["admin_3"])
     await music_on(chat_id)
     await Nand.resume_stream(chat_id)
+    if db.get(chat_id):
+        resume_position(db[chat_id][0])
     await message.reply_text(
         _["admin_4"].format(message.from_user.mention), reply_markup=close_markup(_)
     )
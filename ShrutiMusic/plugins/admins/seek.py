@@ -28,6 +28,7 @@ from ShrutiMusic.core.call import Nand
 from ShrutiMusic.misc import db
 from ShrutiMusic.utils import AdminRightsCheck, seconds_to_min
 from ShrutiMusic.utils.inline import close_markup
+from ShrutiMusic.utils.stream.position import get_played, set_played
 from config import BANNED_USERS
 
 
@@ -50,7 +51,7 @@ async def seek_comm(cli, message: Message, _, chat_id):
     if duration_seconds == 0:
         return await message.reply_text(_["admin_22"])
     file_path = playing[0]["file"]
-    duration_played = int(playing[0]["played"])
+    duration_played = get_played(playing[0])
     duration_to_skip = int(query)
     duration = playing[0]["dur"]
     if message.command[0][-2] == "c":
@@ -72,9 +73,11 @@ async def seek_comm(cli, message: Message, _, chat_id):
         n, file_path = await YouTube.video(playing[0]["vidid"], True)
         if n == 0:
             return await message.reply_text(_["admin_22"])
+    speed = playing[0].get("speed")
     check = (playing[0]).get("speed_path")
     if check:
         file_path = check
+        speed = None
     if "index_" in file_path:
         file_path = playing[0]["vidid"]
     try:
@@ -84,13 +87,14 @@ async def seek_comm(cli, message: Message, _, chat_id):
             seconds_to_min(to_seek),
             duration,
             playing[0]["streamtype"],
+            speed,
         )
     except:
         return await mystic.edit_text(_["admin_26"], reply_markup=close_markup(_))
     if message.command[0][-2] == "c":
-        db[chat_id][0]["played"] -= duration_to_skip
+        set_played(db[chat_id][0], duration_played - duration_to_skip)
     else:
-        db[chat_id][0]["played"] += duration_to_skip
+        set_played(db[chat_id][0], duration_played + duration_to_skip)
     await mystic.edit_text(
         text=_["admin_25"].format(seconds_to_min(to_seek), message.from_user.mention),
         reply_markup=close_markup(_),
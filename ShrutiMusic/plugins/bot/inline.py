@@ -20,51 +20,47 @@
 # Email: badboy809075@gmail.com
 
 
+import asyncio
+
 from pyrogram.types import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     InlineQueryResultPhoto,
 )
-from youtubesearchpython.__future__ import VideosSearch
 
 from ShrutiMusic import app
 from ShrutiMusic.utils.inlinequery import answer
+from ShrutiMusic.utils.searchcache import cache_key, search_cache, search_videos
 from config import BANNED_USERS
 
+INLINE_LIMIT = 20
+INLINE_PAGE = 10
+INLINE_DEBOUNCE = 0.4
 
-@app.on_inline_query(~BANNED_USERS)
-async def inline_query_handler(client, query):
-    text = query.query.strip().lower()
-    answers = []
-    if text.strip() == "":
-        try:
-            await client.answer_inline_query(query.id, results=answer, cache_time=10)
-        except:
-            return
-    else:
-        a = VideosSearch(text, limit=20)
-        result = (await a.next()).get("result")
-        for x in range(15):
-            title = (result[x]["title"]).title()
-            duration = result[x]["duration"]
-            views = result[x]["viewCount"]["short"]
-            thumbnail = result[x]["thumbnails"][0]["url"].split("?")[0]
-            channellink = result[x]["channel"]["link"]
-            channel = result[x]["channel"]["name"]
-            link = result[x]["link"]
-            published = result[x]["publishedTime"]
-            description = f"{views} | {duration} ᴍɪɴᴜᴛᴇs | {channel}  | {published}"
-            buttons = InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text="ʏᴏᴜᴛᴜʙᴇ 🎄",
-                            url=link,
-                        )
-                    ],
-                ]
-            )
-            searched_text = f"""
+latest = {}
+
+
+def inline_result(result: dict):
+    title = (result["title"]).title()
+    duration = result["duration"]
+    views = result["viewCount"]["short"]
+    thumbnail = result["thumbnails"][0]["url"].split("?")[0]
+    channellink = result["channel"]["link"]
+    channel = result["channel"]["name"]
+    link = result["link"]
+    published = result["publishedTime"]
+    description = f"{views} | {duration} ᴍɪɴᴜᴛᴇs | {channel}  | {published}"
+    buttons = InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    text="ʏᴏᴜᴛᴜʙᴇ 🎄",
+                    url=link,
+                )
+            ],
+        ]
+    )
+    searched_text = f"""
 ❄ <b>ᴛɪᴛʟᴇ :</b> <a href={link}>{title}</a>
 
 ⏳ <b>ᴅᴜʀᴀᴛɪᴏɴ :</b> {duration} ᴍɪɴᴜᴛᴇs
@@ -74,18 +70,51 @@ async def inline_query_handler(client, query):
 
 
 <u><b>➻ ɪɴʟɪɴᴇ sᴇᴀʀᴄʜ ᴍᴏᴅᴇ ʙʏ {app.name}</b></u>"""
-            answers.append(
-                InlineQueryResultPhoto(
-                    photo_url=thumbnail,
-                    title=title,
-                    thumb_url=thumbnail,
-                    description=description,
-                    caption=searched_text,
-                    reply_markup=buttons,
-                )
-            )
+    return InlineQueryResultPhoto(
+        photo_url=thumbnail,
+        title=title,
+        thumb_url=thumbnail,
+        description=description,
+        caption=searched_text,
+        reply_markup=buttons,
+    )
+
+
+@app.on_inline_query(~BANNED_USERS)
+async def inline_query_handler(client, query):
+    text = query.query.strip().lower()
+    if text.strip() == "":
         try:
-            return await client.answer_inline_query(query.id, results=answers)
+            await client.answer_inline_query(query.id, results=answer, cache_time=10)
+        except:
+            return
+    else:
+        user_id = query.from_user.id
+        if search_cache.get(cache_key(text, INLINE_LIMIT)) is None:
+            latest[user_id] = query.id
+            await asyncio.sleep(INLINE_DEBOUNCE)
+            if latest.get(user_id) != query.id:
+                return
+            latest.pop(user_id, None)
+        try:
+            result = await search_videos(text, limit=INLINE_LIMIT)
+        except:
+            result = []
+        offset = int(query.offset or 0)
+        answers = []
+        for item in result[offset : offset + INLINE_PAGE]:
+            try:
+                answers.append(inline_result(item))
+            except (KeyError, IndexError, TypeError):
+                continue
+        next_offset = offset + INLINE_PAGE
+        try:
+            return await client.answer_inline_query(
+                query.id,
+                results=answers,
+                cache_time=300 if answers else 5,
+                next_offset=str(next_offset) if next_offset < len(result) else "",
+            )
         except:
             return
 
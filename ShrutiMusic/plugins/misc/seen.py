@@ -19,32 +19,29 @@
 # Contact for permissions:
 # Email: badboy809075@gmail.com
 
+from pyrogram import filters
+from pyrogram.types import Message
 
-import asyncio
+from ShrutiMusic import app
+from ShrutiMusic.utils.database import add_seen, is_banned_user
+from config import BANNED_USERS
 
-from ShrutiMusic.misc import db
-from ShrutiMusic.utils.database import get_active_chats, is_music_playing
 
+@app.on_message(filters.group & filters.new_chat_members, group=41)
+async def seen_members(client, message: Message):
+    for member in message.new_chat_members:
+        await add_seen(member.id, message.chat.id)
+        if member.id in BANNED_USERS and await is_banned_user(member.id):
+            try:
+                await app.ban_chat_member(message.chat.id, member.id)
+            except:
+                pass
 
-async def timer():
-    while not await asyncio.sleep(1):
-        active_chats = await get_active_chats()
-        for chat_id in active_chats:
-            if not await is_music_playing(chat_id):
-                continue
-            playing = db.get(chat_id)
-            if not playing:
-                continue
-            duration = int(playing[0]["seconds"])
-            if duration == 0:
-                continue
-            if db[chat_id][0]["played"] >= duration:
-                continue
-            db[chat_id][0]["played"] += 1
-
-
-asyncio.create_task(timer())
 
+@app.on_message(filters.group & filters.incoming & ~filters.service, group=40)
+async def seen_watcher(client, message: Message):
+    if message.from_user:
+        await add_seen(message.from_user.id, message.chat.id)
 
 # ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
 
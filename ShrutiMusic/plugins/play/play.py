@@ -46,6 +46,8 @@ from ShrutiMusic.utils.logger import play_logs
 from ShrutiMusic.utils.stream.stream import stream
 from config import BANNED_USERS, lyrical
 
+slider_thumbs = {}
+
 
 @app.on_message(
     filters.command(
@@ -654,43 +656,36 @@ async def slider_queries(client, CallbackQuery, _):
             query_type = 0
         else:
             query_type = int(rtype + 1)
-        try:
-            await CallbackQuery.answer(_["playcb_2"])
-        except:
-            pass
-        title, duration_min, thumbnail, vidid = await YouTube.slider(query, query_type)
-        buttons = slider_markup(_, vidid, user_id, query, query_type, cplay, fplay)
-        med = InputMediaPhoto(
-            media=thumbnail,
-            caption=_["play_10"].format(
-                title.title(),
-                duration_min,
-            ),
-        )
-        return await CallbackQuery.edit_message_media(
-            media=med, reply_markup=InlineKeyboardMarkup(buttons)
-        )
-    if what == "B":
+    elif what == "B":
         if rtype == 0:
             query_type = 9
         else:
             query_type = int(rtype - 1)
-        try:
-            await CallbackQuery.answer(_["playcb_2"])
-        except:
-            pass
-        title, duration_min, thumbnail, vidid = await YouTube.slider(query, query_type)
-        buttons = slider_markup(_, vidid, user_id, query, query_type, cplay, fplay)
-        med = InputMediaPhoto(
-            media=thumbnail,
-            caption=_["play_10"].format(
-                title.title(),
-                duration_min,
-            ),
-        )
-        return await CallbackQuery.edit_message_media(
-            media=med, reply_markup=InlineKeyboardMarkup(buttons)
-        )
+    else:
+        return
+    try:
+        await CallbackQuery.answer(_["playcb_2"])
+    except:
+        pass
+    title, duration_min, thumbnail, vidid = await YouTube.slider(
+        query, query_type, user_id=int(user_id)
+    )
+    buttons = slider_markup(_, vidid, user_id, query, query_type, cplay, fplay)
+    med = InputMediaPhoto(
+        media=slider_thumbs.get(vidid, thumbnail),
+        caption=_["play_10"].format(
+            title.title(),
+            duration_min,
+        ),
+    )
+    edited = await CallbackQuery.edit_message_media(
+        media=med, reply_markup=InlineKeyboardMarkup(buttons)
+    )
+    if getattr(edited, "photo", None):
+        if len(slider_thumbs) >= 5000:
+            slider_thumbs.pop(next(iter(slider_thumbs)))
+        slider_thumbs[vidid] = edited.photo.file_id
+    return edited
 
 
 # ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
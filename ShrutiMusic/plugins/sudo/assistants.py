@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+from pyrogram import filters
+from pyrogram.types import Message
+
+from ShrutiMusic import app
+from ShrutiMusic.misc import SUDOERS
+from ShrutiMusic.utils.database import get_assistants_load, get_client
+
+
+@app.on_message(filters.command("assistants") & SUDOERS)
+async def assistants_load(_, message: Message):
+    load = await get_assistants_load()
+    if not load:
+        return await message.reply_text("» ɴᴏ ᴀssɪsᴛᴀɴᴛs ᴀʀᴇ ʀᴜɴɴɪɴɢ.")
+    text = "<b>» ᴀssɪsᴛᴀɴᴛs ʟᴏᴀᴅ :</b>\n\n"
+    for number, stats in load.items():
+        userbot = await get_client(number)
+        text += f"<b>{number}.</b> {userbot.name}\n"
+        text += f"   ᴄᴀʟʟs : <code>{stats['calls']}</code> | ᴊᴏɪɴɪɴɢ : <code>{stats['joining']}</code>"
+        if stats["cooldown"]:
+            text += f" | ғʟᴏᴏᴅᴡᴀɪᴛ : <code>{stats['cooldown']}s</code>"
+        text += "\n"
+    await message.reply_text(text)
+
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
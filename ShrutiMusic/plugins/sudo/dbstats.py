@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+
+from pyrogram import filters
+from pyrogram.types import Message
+
+from ShrutiMusic import app
+from ShrutiMusic.core.mongo import monitor
+from ShrutiMusic.core.schema import get_db_stats
+from ShrutiMusic.misc import SUDOERS
+
+
+@app.on_message(filters.command("dbstats") & SUDOERS)
+async def database_stats(_, message: Message):
+    mystic = await message.reply_text("» ɢᴇᴛᴛɪɴɢ ᴅᴀᴛᴀʙᴀsᴇ sᴛᴀᴛs...")
+    stats = await get_db_stats()
+    text = f"<b>» ᴅᴀᴛᴀʙᴀsᴇ sᴛᴀᴛs :</b>\nsʟᴏᴡ ǫᴜᴇʀɪᴇs : <code>{monitor.slow}</code>\n\n"
+    for name, stat in stats.items():
+        text += f"<b>{name}</b> : <code>{stat['count']}</code> ᴅᴏᴄs"
+        if stat["p95"] is not None:
+            text += f" | ᴘ95 : <code>{stat['p95']} ms</code>"
+        text += "\n"
+        for index, ops in stat["indexes"].items():
+            text += f"   {index} : <code>{ops}</code> ᴏᴘs\n"
+    await mystic.edit_text(text[:4096])
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -20,12 +20,10 @@
 # Email: badboy809075@gmail.com
 
 
-import asyncio
-
 from pyrogram import filters
-from pyrogram.errors import FloodWait
 from pyrogram.types import Message
 
+import config
 from ShrutiMusic import app
 from ShrutiMusic.misc import SUDOERS
 from ShrutiMusic.utils import get_readable_time
@@ -33,15 +31,32 @@ from ShrutiMusic.utils.database import (
     add_banned_user,
     get_banned_count,
     get_banned_users,
-    get_served_chats,
+    get_lang,
     is_banned_user,
     remove_banned_user,
 )
 from ShrutiMusic.utils.decorators.language import language
 from ShrutiMusic.utils.extraction import extract_user
+from ShrutiMusic.utils.gban import create_gban, jobs
 from config import BANNED_USERS
 
 
+async def fan_out(message: Message, _, action: str, user, notice: str):
+    job = await create_gban(
+        action,
+        user.id,
+        user.mention,
+        message.from_user.mention,
+        message.chat.id,
+        message.chat.title,
+        await get_lang(message.chat.id),
+    )
+    time_expected = get_readable_time(max(1, job.doc["total"] // config.GBAN_RATE))
+    mystic = await message.reply_text(_[notice].format(user.mention, time_expected))
+    job.doc["notice"] = mystic.id
+    await job.launch()
+
+
 @app.on_message(filters.command(["gban", "globalban"]) & SUDOERS)
 @language
 async def global_ban(client, message: Message, _):
@@ -60,34 +75,8 @@ async def global_ban(client, message: Message, _):
         return await message.reply_text(_["gban_4"].format(user.mention))
     if user.id not in BANNED_USERS:
         BANNED_USERS.add(user.id)
-    served_chats = []
-    chats = await get_served_chats()
-    for chat in chats:
-        served_chats.append(int(chat["chat_id"]))
-    time_expected = get_readable_time(len(served_chats))
-    mystic = await message.reply_text(_["gban_5"].format(user.mention, time_expected))
-    number_of_chats = 0
-    for chat_id in served_chats:
-        try:
-            await app.ban_chat_member(chat_id, user.id)
-            number_of_chats += 1
-        except FloodWait as fw:
-            await asyncio.sleep(int(fw.value))
-        except:
-            continue
     await add_banned_user(user.id)
-    await message.reply_text(
-        _["gban_6"].format(
-            app.mention,
-            message.chat.title,
-            message.chat.id,
-            user.mention,
-            user.id,
-            message.from_user.mention,
-            number_of_chats,
-        )
-    )
-    await mystic.delete()
+    await fan_out(message, _, "ban", user, "gban_5")
 
 
 @app.on_message(filters.command(["ungban"]) & SUDOERS)
@@ -102,24 +91,25 @@ async def global_un(client, message: Message, _):
         return await message.reply_text(_["gban_7"].format(user.mention))
     if user.id in BANNED_USERS:
         BANNED_USERS.remove(user.id)
-    served_chats = []
-    chats = await get_served_chats()
-    for chat in chats:
-        served_chats.append(int(chat["chat_id"]))
-    time_expected = get_readable_time(len(served_chats))
-    mystic = await message.reply_text(_["gban_8"].format(user.mention, time_expected))
-    number_of_chats = 0
-    for chat_id in served_chats:
-        try:
-            await app.unban_chat_member(chat_id, user.id)
-            number_of_chats += 1
-        except FloodWait as fw:
-            await asyncio.sleep(int(fw.value))
-        except:
-            continue
     await remove_banned_user(user.id)
-    await message.reply_text(_["gban_9"].format(user.mention, number_of_chats))
-    await mystic.delete()
+    await fan_out(message, _, "unban", user, "gban_8")
+
+
+@app.on_message(filters.command(["gbanstatus"]) & SUDOERS)
+async def gban_status(client, message: Message):
+    if not jobs:
+        return await message.reply_text("» ɴᴏ ɢʟᴏʙᴀʟ ʙᴀɴ ɪs ʀᴜɴɴɪɴɢ.")
+    text = "<b>» ʀᴜɴɴɪɴɢ ɢʟᴏʙᴀʟ ʙᴀɴs :</b>\n\n"
+    for job_id, job in jobs.items():
+        doc = job.doc
+        done = doc["done"] + doc["skipped"]
+        text += (
+            f"<code>{job_id}</code> | {doc['action']} <code>{doc['user_id']}</code> : "
+            f"<code>{done}/{doc['total']}</code>\n"
+            f"   ᴅᴏɴᴇ : <code>{doc['done']}</code> | sᴋɪᴘᴘᴇᴅ : <code>{doc['skipped']}</code>"
+            f" | ʟɪᴍɪᴛ : <code>{round(job.bucket.rate, 1)}/s</code>\n"
+        )
+    await message.reply_text(text)
 
 
 @app.on_message(filters.command(["gbannedusers", "gbanlist"]) & SUDOERS)
@@ -11,6 +11,7 @@ import requests
 
 from ShrutiMusic.utils import get_image, get_couple, save_couple
 from ShrutiMusic import app
+from ShrutiMusic.core.executor import cpu_pool, io_pool
 
 
 # get current date in GMT+5:30 timezone
@@ -40,6 +41,33 @@ def download_image(url, path):
     return path
 
 
+def render_couple(p1, p2, background_image_path, test_image_path):
+    img1 = Image.open(p1)
+    img2 = Image.open(p2)
+    img = Image.open(background_image_path)
+
+    img1 = img1.resize((437, 437))
+    img2 = img2.resize((437, 437))
+
+    mask = Image.new("L", img1.size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((0, 0) + img1.size, fill=255)
+
+    mask1 = Image.new("L", img2.size, 0)
+    draw = ImageDraw.Draw(mask1)
+    draw.ellipse((0, 0) + img2.size, fill=255)
+
+    img1.putalpha(mask)
+    img2.putalpha(mask1)
+
+    draw = ImageDraw.Draw(img)
+
+    img.paste(img1, (116, 160), img1)
+    img.paste(img2, (789, 160), img2)
+
+    img.save(test_image_path)
+
+
 # Dates
 tomorrow = get_todmorrow_date()
 today = get_today_date()
@@ -80,44 +108,28 @@ async def ctest(_, message):
             try:
                 p1 = await app.download_media(photo1.big_file_id, file_name=p1_path)
             except Exception:
-                p1 = download_image(
-                    "https://telegra.ph/file/05aa686cf52fc666184bf.jpg", p1_path
+                p1 = await io_pool.run(
+                    download_image,
+                    "https://telegra.ph/file/05aa686cf52fc666184bf.jpg",
+                    p1_path,
                 )
             try:
                 p2 = await app.download_media(photo2.big_file_id, file_name=p2_path)
             except Exception:
-                p2 = download_image(
-                    "https://telegra.ph/file/05aa686cf52fc666184bf.jpg", p2_path
+                p2 = await io_pool.run(
+                    download_image,
+                    "https://telegra.ph/file/05aa686cf52fc666184bf.jpg",
+                    p2_path,
                 )
 
-            img1 = Image.open(p1)
-            img2 = Image.open(p2)
-
-            background_image_path = download_image(
-                "https://telegra.ph/file/96f36504f149e5680741a.jpg", cppic_path
+            background_image_path = await io_pool.run(
+                download_image,
+                "https://telegra.ph/file/96f36504f149e5680741a.jpg",
+                cppic_path,
+            )
+            await cpu_pool.run(
+                render_couple, p1, p2, background_image_path, test_image_path
             )
-            img = Image.open(background_image_path)
-
-            img1 = img1.resize((437, 437))
-            img2 = img2.resize((437, 437))
-
-            mask = Image.new("L", img1.size, 0)
-            draw = ImageDraw.Draw(mask)
-            draw.ellipse((0, 0) + img1.size, fill=255)
-
-            mask1 = Image.new("L", img2.size, 0)
-            draw = ImageDraw.Draw(mask1)
-            draw.ellipse((0, 0) + img2.size, fill=255)
-
-            img1.putalpha(mask)
-            img2.putalpha(mask1)
-
-            draw = ImageDraw.Draw(img)
-
-            img.paste(img1, (116, 160), img1)
-            img.paste(img2, (789, 160), img2)
-
-            img.save(test_image_path)
 
             TXT = f"""
 <b>Tᴏᴅᴀʏ's ᴄᴏᴜᴘʟᴇ ᴏғ ᴛʜᴇ ᴅᴀʏ:
@@ -143,7 +155,7 @@ Nᴇxᴛ ᴄᴏᴜᴘʟᴇs ᴡɪʟʟ ʙᴇ sᴇʟᴇᴄᴛᴇᴅ ᴏɴ {tomorro
             )
 
             await msg.delete()
-            a = upload_file(test_image_path)
+            a = await io_pool.run(upload_file, test_image_path)
             for x in a:
                 img_url = "https://graph.org/" + x
                 couple = {"c1_id": c1_id, "c2_id": c2_id}
@@ -23,9 +23,18 @@
 from pyrogram import filters
 from pyrogram.types import Message
 from ShrutiMusic import app
+from ShrutiMusic.core.executor import io_pool
 import requests
 import os
 
+
+def download_file(url, file_name):
+    with requests.get(url, stream=True) as v:
+        with open(file_name, "wb") as f:
+            for chunk in v.iter_content(chunk_size=8192):
+                f.write(chunk)
+    return file_name
+
 @app.on_message(filters.command("vid"))
 async def video_downloader(_, message: Message):
     if len(message.command) < 2:
@@ -47,7 +56,7 @@ async def video_downloader(_, message: Message):
     }
 
     try:
-        r = requests.post("https://allvideodownloader.cc/wp-json/aio-dl/video-data/", data=payload, headers=headers)
+        r = await io_pool.run(requests.post, "https://allvideodownloader.cc/wp-json/aio-dl/video-data/", data=payload, headers=headers)
         data = r.json()
 
         if "medias" not in data or not data["medias"]:
@@ -61,10 +70,7 @@ async def video_downloader(_, message: Message):
         await msg.edit("⬇️ Downloading video...")
 
         file_name = "video.mp4"
-        with requests.get(video_link, stream=True) as v:
-            with open(file_name, "wb") as f:
-                for chunk in v.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        await io_pool.run(download_file, video_link, file_name)
 
         # Step 4: Send video to user
         await app.send_video(
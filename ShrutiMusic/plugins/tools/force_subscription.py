@@ -22,19 +22,55 @@
 
 from pyrogram import Client, filters
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery, ChatPermissions
-from pymongo import MongoClient
 from ShrutiMusic import app
 import asyncio
+import time
+import config
+from ShrutiMusic.core.mongo import _mongo_async_
+from ShrutiMusic.logging import LOGGER
 from ShrutiMusic.misc import SUDOERS
-from config import MONGO_DB_URI
 from pyrogram.enums import ChatMembersFilter
 from pyrogram.errors import (
     ChatAdminRequired,
     UserNotParticipant,
 )
 
-fsubdb = MongoClient(MONGO_DB_URI)
-forcesub_collection = fsubdb.status_db.status
+forcesub_collection = _mongo_async_.status_db.status
+
+forcesub = {}
+membership = {}
+
+
+async def load_forcesub():
+    try:
+        async for data in forcesub_collection.find({}):
+            forcesub[data["chat_id"]] = data
+    except Exception as e:
+        LOGGER(__name__).error(f"Failed to load force subscription settings: {e}")
+
+
+loader = asyncio.create_task(load_forcesub())
+
+
+async def is_channel_member(channel_id: int, user_id: int) -> bool:
+    key = (channel_id, user_id)
+    cached = membership.get(key)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    try:
+        await app.get_chat_member(channel_id, user_id)
+        verdict = True
+    except UserNotParticipant:
+        verdict = False
+    ttl = config.FSUB_MEMBER_TTL if verdict else config.FSUB_NONMEMBER_TTL
+    if len(membership) >= config.FSUB_CACHE_SIZE:
+        now = time.monotonic()
+        for stale in [k for k, v in membership.items() if v[1] <= now]:
+            del membership[stale]
+        if len(membership) >= config.FSUB_CACHE_SIZE:
+            membership.clear()
+    membership[key] = (verdict, time.monotonic() + ttl)
+    return verdict
 
 @app.on_message(filters.command(["fsub", "forcesub"]) & filters.group)
 async def set_forcesub(client: Client, message: Message):
@@ -47,7 +83,8 @@ async def set_forcesub(client: Client, message: Message):
         return await message.reply_text("**ᴏɴʟʏ ɢʀᴏᴜᴘ ᴀᴅᴍɪɴs ᴏʀ sᴜᴅᴏᴇʀs ᴄᴀɴ ᴜsᴇ ᴛʜɪs ᴄᴏᴍᴍᴀɴᴅ.**")
 
     if len(message.command) == 2 and message.command[1].lower() in ["off", "disable"]:
-        forcesub_collection.delete_one({"chat_id": chat_id})
+        forcesub.pop(chat_id, None)
+        await forcesub_collection.delete_one({"chat_id": chat_id})
         return await message.reply_text("**ғᴏʀᴄᴇ sᴜʙsᴄʀɪᴘᴛɪᴏɴ ʜᴀs ʙᴇᴇɴ ᴅɪsᴀʙʟᴇᴅ ғᴏʀ ᴛʜɪs ɢʀᴏᴜᴘ.**")
 
     if len(message.command) != 2:
@@ -60,11 +97,16 @@ async def set_forcesub(client: Client, message: Message):
         channel_id = channel_info.id
         channel_username = f"{channel_info.username}" if channel_info.username else None
 
-        forcesub_collection.update_one(
+        await forcesub_collection.update_one(
             {"chat_id": chat_id},
             {"$set": {"channel_id": channel_id, "channel_username": channel_username}},
             upsert=True
         )
+        forcesub[chat_id] = {
+            "chat_id": chat_id,
+            "channel_id": channel_id,
+            "channel_username": channel_username,
+        }
 
         await message.reply_text(f"**🎉 Force subscription set to channel:** [{channel_info.title}](https://t.me/{channel_username})")
 
@@ -75,7 +117,8 @@ async def set_forcesub(client: Client, message: Message):
 async def on_user_join(client: Client, chat_member_updated):
     chat_id = chat_member_updated.chat.id
     user_id = chat_member_updated.from_user.id
-    forcesub_data = forcesub_collection.find_one({"chat_id": chat_id})
+    await loader
+    forcesub_data = forcesub.get(chat_id)
 
     if not forcesub_data:
         return  # No force subscription set for this group
@@ -91,10 +134,8 @@ async def on_user_join(client: Client, chat_member_updated):
     if new_chat_member.status == "member":
         try:
             # Check if the user is a member of the channel
-            user_member = await app.get_chat_member(channel_id, user_id)
-            # If the user is a member of the channel, do nothing
-            return
-        except UserNotParticipant:
+            if await is_channel_member(channel_id, user_id):
+                return
             # User is not a member of the channel, mute them
             await client.restrict_chat_member(
                 chat_id,
@@ -146,7 +187,8 @@ async def check_forcesub(client: Client, message: Message):
         return  # Exit if the message does not come from a user
 
     user_id = message.from_user.id
-    forcesub_data = forcesub_collection.find_one({"chat_id": chat_id})
+    await loader
+    forcesub_data = forcesub.get(chat_id)
     if not forcesub_data:
         return
 
@@ -154,10 +196,8 @@ async def check_forcesub(client: Client, message: Message):
     channel_username = forcesub_data["channel_username"]
 
     try:
-        user_member = await app.get_chat_member(channel_id, user_id)
-        if user_member:
+        if await is_channel_member(channel_id, user_id):
             return
-    except UserNotParticipant:
         if channel_username:
             channel_url = f"https://t.me/{channel_username}"
         else:
@@ -170,7 +210,8 @@ async def check_forcesub(client: Client, message: Message):
         )
         await asyncio.sleep(1)
     except ChatAdminRequired:
-        forcesub_collection.delete_one({"chat_id": chat_id})
+        forcesub.pop(chat_id, None)
+        await forcesub_collection.delete_one({"chat_id": chat_id})
         return await message.reply_text("**🚫 I'ᴍ ɴᴏ ʟᴏɴɢᴇʀ ᴀɴ ᴀᴅᴍɪɴ ɪɴ ᴛʜᴇ ғᴏʀᴄᴇᴅ sᴜʙsᴄʀɪᴘᴛɪᴏɴ ᴄʜᴀɴɴᴇʟ. ғᴏʀᴄᴇ sᴜʙsᴄʀɪᴘᴛɪᴏɴ ʜᴀs ʙᴇᴇɴ ᴅɪsᴀʙʟᴇᴅ.**")
 
 @app.on_message(filters.group, group=30)
@@ -25,6 +25,7 @@ from pyrogram import filters
 from pyrogram.types import Message
 
 from ShrutiMusic import app
+from ShrutiMusic.core.executor import io_pool
 
 
 @app.on_message(
@@ -75,7 +76,7 @@ bored_api_url = "https://apis.scrimba.com/bored/api/activity"
 
 @app.on_message(filters.command("bored", prefixes="/"))
 async def bored_command(client, message):
-    response = requests.get(bored_api_url)
+    response = await io_pool.run(requests.get, bored_api_url, timeout=10)
     if response.status_code == 200:
         data = response.json()
         activity = data.get("activity")
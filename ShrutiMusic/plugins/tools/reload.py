@@ -29,7 +29,6 @@ from pyrogram.types import CallbackQuery, Message
 
 from ShrutiMusic import app
 from ShrutiMusic.core.call import Nand
-from ShrutiMusic.misc import db
 from ShrutiMusic.utils.database import get_assistant, get_authuser_names, get_cmode
 from ShrutiMusic.utils.decorators import ActualAdminCB, AdminActual, language
 from ShrutiMusic.utils.formatters import alpha_to_int, get_readable_time
@@ -74,7 +73,6 @@ async def restartbot(client, message: Message, _):
     mystic = await message.reply_text(_["reload_4"].format(app.mention))
     await asyncio.sleep(1)
     try:
-        db[message.chat.id] = []
         await Nand.stop_stream_force(message.chat.id)
     except:
         pass
@@ -101,7 +99,6 @@ async def restartbot(client, message: Message, _):
         except:
             pass
         try:
-            db[chat_id] = []
             await Nand.stop_stream_force(chat_id)
         except:
             pass
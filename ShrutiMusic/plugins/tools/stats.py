@@ -32,10 +32,11 @@ from pytgcalls.__version__ import __version__ as pytgver
 
 import config
 from ShrutiMusic import app
+from ShrutiMusic.core.executor import cpu_pool, io_pool
 from ShrutiMusic.core.userbot import assistants
 from ShrutiMusic.misc import SUDOERS, mongodb
 from ShrutiMusic.plugins import ALL_MODULES
-from ShrutiMusic.utils.database import get_served_chats, get_served_users, get_sudoers,is_autoend,is_autoleave
+from ShrutiMusic.utils.database import get_cache_stats, get_served_chats_count, get_served_users_count, get_sudoers,is_autoend,is_autoleave
 from ShrutiMusic.utils.decorators.language import language, languageCB
 from ShrutiMusic.utils.inline.stats import back_stats_buttons, stats_buttons
 from config import BANNED_USERS
@@ -72,8 +73,8 @@ async def overall_stats(client, CallbackQuery, _):
     except:
         pass
     await CallbackQuery.edit_message_text(_["gstats_1"].format(app.mention))
-    served_chats = len(await get_served_chats())
-    served_users = len(await get_served_users())
+    served_chats = await get_served_chats_count()
+    served_users = await get_served_users_count()
     text = _["gstats_3"].format(
         app.mention,
         len(assistants),
@@ -124,8 +125,8 @@ async def bot_stats(client, CallbackQuery, _):
     call = await mongodb.command("dbstats")
     datasize = call["dataSize"] / 1024
     storage = call["storageSize"] / 1024
-    served_chats = len(await get_served_chats())
-    served_users = len(await get_served_users())
+    served_chats = await get_served_chats_count()
+    served_users = await get_served_users_count()
     text = _["gstats_5"].format(
         app.mention,
         len(ALL_MODULES),
@@ -149,6 +150,11 @@ async def bot_stats(client, CallbackQuery, _):
         call["collections"],
         call["objects"],
     )
+    cache = await get_cache_stats()
+    text += f"\n<b>ꜱᴇᴛᴛɪɴɢꜱ ᴄᴀᴄʜᴇ :</b> <code>{cache['hit_rate']}%</code> ʜɪᴛ ʀᴀᴛᴇ, <code>{cache['chats']}</code> ᴄʜᴀᴛꜱ"
+    for pool in (io_pool, cpu_pool):
+        stats = pool.stats()
+        text += f"\n<b>{pool.name.upper()} ᴘᴏᴏʟ :</b> <code>{stats['running']}/{stats['workers']}</code> ʙᴜꜱʏ, <code>{stats['queued']}</code> Qᴜᴇᴜᴇᴅ, <code>{stats['avg_run']}s</code> ᴀᴠɢ"
     med = InputMediaPhoto(media=config.STATS_IMG_URL, caption=text)
     try:
         await CallbackQuery.edit_message_media(media=med, reply_markup=upl)
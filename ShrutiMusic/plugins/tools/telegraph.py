@@ -25,13 +25,14 @@ import requests
 from pyrogram import filters
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from ShrutiMusic import app
+from ShrutiMusic.core.executor import io_pool
 
 
 def upload_file(file_path):
     url = "https://catbox.moe/user/api.php"
     data = {"reqtype": "fileupload", "json": "true"}
-    files = {"fileToUpload": open(file_path, "rb")}
-    response = requests.post(url, data=data, files=files)
+    with open(file_path, "rb") as f:
+        response = requests.post(url, data=data, files={"fileToUpload": f})
 
     if response.status_code == 200:
         return True, response.text.strip()
@@ -71,7 +72,7 @@ async def get_link_group(client, message):
             local_path = await media.download(progress=progress)
             await text.edit_text("📤 Uᴘʟᴏᴀᴅɪɴɢ...")
 
-            success, upload_url = upload_file(local_path)
+            success, upload_url = await io_pool.run(upload_file, local_path)
 
             if success:
                 await text.edit_text(
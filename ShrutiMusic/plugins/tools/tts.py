@@ -26,6 +26,7 @@ from gtts import gTTS
 from pyrogram import filters
 
 from ShrutiMusic import app
+from ShrutiMusic.core.executor import io_pool
 
 
 @app.on_message(filters.command("tts"))
@@ -38,7 +39,7 @@ async def text_to_speech(client, message):
     text = message.text.split(None, 1)[1]
     tts = gTTS(text, lang="hi")
     audio_data = io.BytesIO()
-    tts.write_to_fp(audio_data)
+    await io_pool.run(tts.write_to_fp, audio_data)
     audio_data.seek(0)
 
     audio_file = io.BytesIO(audio_data.read())
@@ -0,0 +1,286 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+
+import asyncio
+import secrets
+import time
+
+from pyrogram.errors import (
+    ChannelInvalid,
+    ChannelPrivate,
+    FloodWait,
+    InputUserDeactivated,
+    UserDeactivated,
+    UserIsBlocked,
+)
+
+import config
+from ShrutiMusic import LOGGER, app
+from ShrutiMusic.core.mongo import mongodb
+from ShrutiMusic.utils.database import (
+    get_served_chats_count,
+    get_served_users_count,
+    remove_served_chats,
+    remove_served_users,
+)
+from strings import get_string
+
+broadcastdb = mongodb.broadcasts
+jobs = {}
+
+DEAD = (
+    ChannelInvalid,
+    ChannelPrivate,
+    InputUserDeactivated,
+    UserDeactivated,
+    UserIsBlocked,
+)
+
+
+class TokenBucket:
+    def __init__(self, rate: float):
+        self.limit = rate
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.paused = 0.0
+        self.streak = 0
+
+    async def take(self):
+        while True:
+            now = time.monotonic()
+            if now < self.paused:
+                await asyncio.sleep(self.paused - now)
+                continue
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def flood(self, seconds: int):
+        self.paused = max(self.paused, time.monotonic() + seconds)
+        self.rate = max(1.0, self.rate / 2)
+        self.tokens = 0
+        self.streak = 0
+
+    def success(self):
+        self.streak += 1
+        if self.streak >= 100 and self.rate < self.limit:
+            self.rate = min(self.limit, self.rate + 1)
+            self.streak = 0
+
+
+class Broadcast:
+    def __init__(self, doc: dict):
+        self.doc = doc
+        self.bucket = TokenBucket(config.BROADCAST_RATE)
+        self.semaphore = asyncio.Semaphore(config.BROADCAST_WORKERS)
+        self.markup = None
+        self.dead = []
+        self.started = time.monotonic()
+        self.done = doc["sent"] + doc["failed"]
+        self.task = None
+
+    @property
+    def chats(self) -> bool:
+        return self.doc["target"] == "chats"
+
+    def throughput(self) -> float:
+        elapsed = max(time.monotonic() - self.started, 1)
+        return round((self.doc["sent"] + self.doc["failed"] - self.done) / elapsed, 2)
+
+    async def send(self, target: int):
+        doc = self.doc
+        if doc["mode"] == "forward":
+            return await app.forward_messages(
+                chat_id=target,
+                from_chat_id=doc["from_chat"],
+                message_ids=doc["message_id"],
+            )
+        if doc["mode"] == "copy":
+            return await app.copy_message(
+                chat_id=target,
+                from_chat_id=doc["from_chat"],
+                message_id=doc["message_id"],
+                reply_markup=self.markup,
+            )
+        return await app.send_message(target, text=doc["text"])
+
+    async def deliver(self, target: int):
+        async with self.semaphore:
+            for _ in range(3):
+                await self.bucket.take()
+                try:
+                    m = await self.send(target)
+                except FloodWait as e:
+                    self.bucket.flood(int(e.value))
+                    continue
+                except DEAD:
+                    self.dead.append(target)
+                    break
+                except Exception:
+                    break
+                self.bucket.success()
+                self.doc["sent"] += 1
+                if self.chats and self.doc["pin"]:
+                    try:
+                        await m.pin(disable_notification=self.doc["pin"] == "quiet")
+                        self.doc["pinned"] += 1
+                    except Exception:
+                        pass
+                return
+            self.doc["failed"] += 1
+
+    async def checkpoint(self, cursor: int):
+        if self.dead:
+            dead, self.dead = self.dead, []
+            self.doc["dead"] += len(dead)
+            if self.chats:
+                await remove_served_chats(dead)
+            else:
+                await remove_served_users(dead)
+        self.doc["cursor"] = cursor
+        await self.save()
+
+    async def save(self):
+        await broadcastdb.replace_one({"_id": self.doc["_id"]}, self.doc, upsert=True)
+
+    async def run(self):
+        doc = self.doc
+        key = "chat_id" if self.chats else "user_id"
+        collection = mongodb.chats if self.chats else mongodb.tgusersdb
+        query = {"$lt": 0} if self.chats else {"$gt": 0}
+        if doc["cursor"] is not None:
+            query["$gt"] = doc["cursor"]
+        if doc["mode"] == "copy":
+            source = await app.get_messages(doc["from_chat"], doc["message_id"])
+            self.markup = source.reply_markup
+        batch = []
+        try:
+            cursor = collection.find({key: query}, {"_id": 0, key: 1}).sort(key, 1)
+            async for row in cursor:
+                batch.append(row[key])
+                if len(batch) < config.BROADCAST_BATCH:
+                    continue
+                await asyncio.gather(*(self.deliver(target) for target in batch))
+                await self.checkpoint(batch[-1])
+                batch = []
+            if batch:
+                await asyncio.gather(*(self.deliver(target) for target in batch))
+                await self.checkpoint(batch[-1])
+            doc["status"] = "done"
+        except asyncio.CancelledError:
+            doc["status"] = "cancelled"
+            raise
+        except Exception as e:
+            doc["status"] = "failed"
+            LOGGER(__name__).warning(f"Broadcast {doc['_id']} failed: {e}")
+        finally:
+            jobs.pop(doc["_id"], None)
+            await self.save()
+            if doc["status"] == "done":
+                await self.report()
+
+    async def report(self):
+        _ = get_string(self.doc["lang"])
+        text = (
+            _["broad_3"].format(self.doc["sent"], self.doc["pinned"])
+            if self.chats
+            else _["broad_4"].format(self.doc["sent"])
+        )
+        try:
+            await app.send_message(self.doc["chat_id"], text)
+        except Exception:
+            pass
+
+    def start(self):
+        jobs[self.doc["_id"]] = self
+        self.task = asyncio.create_task(self.run())
+
+
+async def start_broadcast(
+    target: str,
+    mode: str,
+    chat_id: int,
+    lang: str,
+    from_chat: int = None,
+    message_id: int = None,
+    text: str = None,
+    pin: str = None,
+) -> Broadcast:
+    total = (
+        await get_served_chats_count()
+        if target == "chats"
+        else await get_served_users_count()
+    )
+    job = Broadcast(
+        {
+            "_id": secrets.token_hex(3),
+            "target": target,
+            "mode": mode,
+            "chat_id": chat_id,
+            "lang": lang,
+            "from_chat": from_chat,
+            "message_id": message_id,
+            "text": text,
+            "pin": pin,
+            "total": total,
+            "cursor": None,
+            "sent": 0,
+            "failed": 0,
+            "dead": 0,
+            "pinned": 0,
+            "status": "running",
+        }
+    )
+    await job.save()
+    job.start()
+    return job
+
+
+async def cancel_broadcast(job_id: str) -> bool:
+    job = jobs.get(job_id)
+    if not job:
+        return False
+    job.task.cancel()
+    return True
+
+
+async def resume_broadcasts():
+    async for doc in broadcastdb.find({"status": "running"}):
+        Broadcast(doc).start()
+    if jobs:
+        LOGGER(__name__).info(f"Resumed {len(jobs)} broadcasts.")
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -22,10 +22,14 @@
 
 import random
 import asyncio
+import time
 from datetime import date
 from typing import Dict, List, Union
 
-from ShrutiMusic import userbot
+from pymongo import UpdateOne
+
+import config
+from ShrutiMusic import LOGGER, userbot
 from ShrutiMusic.core.mongo import mongodb
 
 authdb = mongodb.adminauth
@@ -44,6 +48,7 @@ langdb = mongodb.language
 onoffdb = mongodb.onoffper
 playmodedb = mongodb.playmode
 playtypedb = mongodb.playtypedb
+seendb = mongodb.seen
 skipdb = mongodb.skipmode
 sudoersdb = mongodb.sudoers
 usersdb = mongodb.tgusersdb
@@ -52,18 +57,25 @@ usersdb = mongodb.tgusersdb
 active = []
 activevideo = []
 assistantdict = {}
+assistantcalls = {}
+assistantjoins = {}
+assistantflood = {}
+authusers = {}
 autoend = {}
 autoleave = {}
-count = {}
-channelconnect = {}
-langm = {}
+flags = {}
 loop = {}
 maintenance = []
-nonadmin = {}
+onoff = {}
 pause = {}
-playmode = {}
-playtype = {}
-skipmode = {}
+settings = {}
+cachestats = {"hits": 0, "misses": 0}
+servedusers = set()
+servedchats = set()
+pendingusers = set()
+pendingchats = set()
+seenpairs = set()
+pendingseen = set()
 
 
 async def get_assistant_number(chat_id: int) -> str:
@@ -72,16 +84,66 @@ async def get_assistant_number(chat_id: int) -> str:
 
 
 async def get_client(assistant: int):
-    if int(assistant) == 1:
-        return userbot.one
-    elif int(assistant) == 2:
-        return userbot.two
-    elif int(assistant) == 3:
-        return userbot.three
-    elif int(assistant) == 4:
-        return userbot.four
-    elif int(assistant) == 5:
-        return userbot.five
+    return userbot.clients.get(int(assistant))
+
+
+def assistant_load(assistant: int) -> int:
+    return len(assistantcalls.get(assistant, ())) + assistantjoins.get(assistant, 0)
+
+
+def is_assistant_healthy(assistant: int) -> bool:
+    return assistantflood.get(assistant, 0) <= time.monotonic()
+
+
+def pick_assistant() -> int:
+    from ShrutiMusic.core.userbot import assistants
+
+    healthy = [assis for assis in assistants if is_assistant_healthy(assis)]
+    candidates = healthy or assistants
+    least = min(assistant_load(assis) for assis in candidates)
+    return random.choice(
+        [assis for assis in candidates if assistant_load(assis) == least]
+    )
+
+
+def is_assistant_saturated(assistant: int) -> bool:
+    from ShrutiMusic.core.userbot import assistants
+
+    if not is_assistant_healthy(assistant):
+        return True
+    healthy = [assis for assis in assistants if is_assistant_healthy(assis)]
+    least = min(assistant_load(assis) for assis in healthy)
+    return assistant_load(assistant) - least > config.ASSISTANT_REBALANCE_GAP
+
+
+async def add_pending_join(chat_id: int):
+    assistant = assistantdict.get(chat_id)
+    assistantjoins[assistant] = assistantjoins.get(assistant, 0) + 1
+
+
+async def remove_pending_join(chat_id: int):
+    assistant = assistantdict.get(chat_id)
+    assistantjoins[assistant] = max(assistantjoins.get(assistant, 0) - 1, 0)
+
+
+async def report_floodwait(chat_id: int, seconds: int):
+    assistant = assistantdict.get(chat_id)
+    if assistant:
+        assistantflood[assistant] = time.monotonic() + int(seconds)
+
+
+async def get_assistants_load() -> Dict[int, dict]:
+    from ShrutiMusic.core.userbot import assistants
+
+    now = time.monotonic()
+    return {
+        assis: {
+            "calls": len(assistantcalls.get(assis, ())),
+            "joining": assistantjoins.get(assis, 0),
+            "cooldown": max(int(assistantflood.get(assis, 0) - now), 0),
+        }
+        for assis in assistants
+    }
 
 
 async def set_assistant_new(chat_id, number):
@@ -94,9 +156,7 @@ async def set_assistant_new(chat_id, number):
 
 
 async def set_assistant(chat_id):
-    from ShrutiMusic.core.userbot import assistants
-
-    ran_assistant = random.choice(assistants)
+    ran_assistant = pick_assistant()
     assistantdict[chat_id] = ran_assistant
     await assdb.update_one(
         {"chat_id": chat_id},
@@ -127,6 +187,9 @@ async def get_assistant(chat_id: int) -> str:
                 return userbot
     else:
         if assistant in assistants:
+            if chat_id not in active and is_assistant_saturated(assistant):
+                userbot = await set_assistant(chat_id)
+                return userbot
             userbot = await get_client(assistant)
             return userbot
         else:
@@ -135,9 +198,7 @@ async def get_assistant(chat_id: int) -> str:
 
 
 async def set_calls_assistant(chat_id):
-    from ShrutiMusic.core.userbot import assistants
-
-    ran_assistant = random.choice(assistants)
+    ran_assistant = pick_assistant()
     assistantdict[chat_id] = ran_assistant
     await assdb.update_one(
         {"chat_id": chat_id},
@@ -167,94 +228,120 @@ async def group_assistant(self, chat_id: int) -> int:
             assis = assistant
         else:
             assis = await set_calls_assistant(chat_id)
-    if int(assis) == 1:
-        return self.one
-    elif int(assis) == 2:
-        return self.two
-    elif int(assis) == 3:
-        return self.three
-    elif int(assis) == 4:
-        return self.four
-    elif int(assis) == 5:
-        return self.five
+    return self.calls.get(int(assis))
+
+
+async def get_chat_settings(chat_id: int) -> dict:
+    chat = settings.get(chat_id)
+    if chat is not None:
+        cachestats["hits"] += 1
+        return chat
+    cachestats["misses"] += 1
+    query = {"chat_id": chat_id}
+    skip, upvote, cmode, ptype, pmode, lang, auth = await asyncio.gather(
+        skipdb.find_one(query),
+        countdb.find_one(query),
+        channeldb.find_one(query),
+        playtypedb.find_one(query),
+        playmodedb.find_one(query),
+        langdb.find_one(query),
+        authdb.find_one(query),
+    )
+    chat = settings.setdefault(
+        chat_id,
+        {
+            "skipmode": not skip,
+            "upvotes": upvote["mode"] if upvote else 5,
+            "cmode": cmode["mode"] if cmode else None,
+            "playtype": ptype["mode"] if ptype else "Everyone",
+            "playmode": pmode["mode"] if pmode else "Direct",
+            "lang": lang["lang"] if lang else "en",
+            "nonadmin": bool(auth),
+        },
+    )
+    return chat
+
+
+async def get_cache_stats() -> dict:
+    total = cachestats["hits"] + cachestats["misses"]
+    return {
+        "hits": cachestats["hits"],
+        "misses": cachestats["misses"],
+        "hit_rate": round(cachestats["hits"] * 100 / total, 2) if total else 0.0,
+        "chats": len(settings),
+    }
 
 
 async def is_skipmode(chat_id: int) -> bool:
-    mode = skipmode.get(chat_id)
-    if not mode:
-        user = await skipdb.find_one({"chat_id": chat_id})
-        if not user:
-            skipmode[chat_id] = True
-            return True
-        skipmode[chat_id] = False
-        return False
-    return mode
+    chat = await get_chat_settings(chat_id)
+    return chat["skipmode"]
 
 
 async def skip_on(chat_id: int):
-    skipmode[chat_id] = True
-    user = await skipdb.find_one({"chat_id": chat_id})
-    if user:
-        return await skipdb.delete_one({"chat_id": chat_id})
+    chat = await get_chat_settings(chat_id)
+    if chat["skipmode"]:
+        return
+    chat["skipmode"] = True
+    return await skipdb.delete_one({"chat_id": chat_id})
 
 
 async def skip_off(chat_id: int):
-    skipmode[chat_id] = False
-    user = await skipdb.find_one({"chat_id": chat_id})
-    if not user:
-        return await skipdb.insert_one({"chat_id": chat_id})
+    chat = await get_chat_settings(chat_id)
+    if not chat["skipmode"]:
+        return
+    chat["skipmode"] = False
+    return await skipdb.insert_one({"chat_id": chat_id})
 
 
 async def get_upvote_count(chat_id: int) -> int:
-    mode = count.get(chat_id)
-    if not mode:
-        mode = await countdb.find_one({"chat_id": chat_id})
-        if not mode:
-            return 5
-        count[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    chat = await get_chat_settings(chat_id)
+    return chat["upvotes"]
 
 
 async def set_upvotes(chat_id: int, mode: int):
-    count[chat_id] = mode
+    chat = await get_chat_settings(chat_id)
+    chat["upvotes"] = mode
     await countdb.update_one(
         {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
     )
 
 
 async def is_autoend() -> bool:
-    chat_id = 1234
-    user = await autoenddb.find_one({"chat_id": chat_id})
-    if not user:
-        return False
-    return True
+    if "autoend" not in flags:
+        flags["autoend"] = bool(await autoenddb.find_one({"chat_id": 1234}))
+    return flags["autoend"]
 
 
 async def autoend_on():
     chat_id = 1234
+    if await is_autoend():
+        return
+    flags["autoend"] = True
     await autoenddb.insert_one({"chat_id": chat_id})
 
 
 async def autoend_off():
     chat_id = 1234
+    flags["autoend"] = False
     await autoenddb.delete_one({"chat_id": chat_id})
 
 async def is_autoleave() -> bool:
-    chat_id = 1234
-    user = await autoleavedb.find_one({"chat_id": chat_id})
-    if not user:
-        return False
-    return True
+    if "autoleave" not in flags:
+        flags["autoleave"] = bool(await autoleavedb.find_one({"chat_id": 1234}))
+    return flags["autoleave"]
 
 
 async def autoleave_on():
     chat_id = 1234
+    if await is_autoleave():
+        return
+    flags["autoleave"] = True
     await autoleavedb.insert_one({"chat_id": chat_id})
 
 
 async def autoleave_off():
     chat_id = 1234
+    flags["autoleave"] = False
     await autoleavedb.delete_one({"chat_id": chat_id})
 
 
@@ -270,75 +357,52 @@ async def set_loop(chat_id: int, mode: int):
 
 
 async def get_cmode(chat_id: int) -> int:
-    mode = channelconnect.get(chat_id)
-    if not mode:
-        mode = await channeldb.find_one({"chat_id": chat_id})
-        if not mode:
-            return None
-        channelconnect[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    chat = await get_chat_settings(chat_id)
+    return chat["cmode"]
 
 
 async def set_cmode(chat_id: int, mode: int):
-    channelconnect[chat_id] = mode
+    chat = await get_chat_settings(chat_id)
+    chat["cmode"] = mode
     await channeldb.update_one(
         {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
     )
 
 
 async def get_playtype(chat_id: int) -> str:
-    mode = playtype.get(chat_id)
-    if not mode:
-        mode = await playtypedb.find_one({"chat_id": chat_id})
-        if not mode:
-            playtype[chat_id] = "Everyone"
-            return "Everyone"
-        playtype[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    chat = await get_chat_settings(chat_id)
+    return chat["playtype"]
 
 
 async def set_playtype(chat_id: int, mode: str):
-    playtype[chat_id] = mode
+    chat = await get_chat_settings(chat_id)
+    chat["playtype"] = mode
     await playtypedb.update_one(
         {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
     )
 
 
 async def get_playmode(chat_id: int) -> str:
-    mode = playmode.get(chat_id)
-    if not mode:
-        mode = await playmodedb.find_one({"chat_id": chat_id})
-        if not mode:
-            playmode[chat_id] = "Direct"
-            return "Direct"
-        playmode[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    chat = await get_chat_settings(chat_id)
+    return chat["playmode"]
 
 
 async def set_playmode(chat_id: int, mode: str):
-    playmode[chat_id] = mode
+    chat = await get_chat_settings(chat_id)
+    chat["playmode"] = mode
     await playmodedb.update_one(
         {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
     )
 
 
 async def get_lang(chat_id: int) -> str:
-    mode = langm.get(chat_id)
-    if not mode:
-        lang = await langdb.find_one({"chat_id": chat_id})
-        if not lang:
-            langm[chat_id] = "en"
-            return "en"
-        langm[chat_id] = lang["lang"]
-        return lang["lang"]
-    return mode
+    chat = await get_chat_settings(chat_id)
+    return chat["lang"]
 
 
 async def set_lang(chat_id: int, lang: str):
-    langm[chat_id] = lang
+    chat = await get_chat_settings(chat_id)
+    chat["lang"] = lang
     await langdb.update_one({"chat_id": chat_id}, {"$set": {"lang": lang}}, upsert=True)
 
 
@@ -371,11 +435,16 @@ async def is_active_chat(chat_id: int) -> bool:
 async def add_active_chat(chat_id: int):
     if chat_id not in active:
         active.append(chat_id)
+    assistant = assistantdict.get(chat_id)
+    if assistant:
+        assistantcalls.setdefault(assistant, set()).add(chat_id)
 
 
 async def remove_active_chat(chat_id: int):
     if chat_id in active:
         active.remove(chat_id)
+    for chats in assistantcalls.values():
+        chats.discard(chat_id)
 
 
 async def get_active_video_chats() -> list:
@@ -400,51 +469,41 @@ async def remove_active_video_chat(chat_id: int):
 
 
 async def check_nonadmin_chat(chat_id: int) -> bool:
-    user = await authdb.find_one({"chat_id": chat_id})
-    if not user:
-        return False
-    return True
+    return await is_nonadmin_chat(chat_id)
 
 
 async def is_nonadmin_chat(chat_id: int) -> bool:
-    mode = nonadmin.get(chat_id)
-    if not mode:
-        user = await authdb.find_one({"chat_id": chat_id})
-        if not user:
-            nonadmin[chat_id] = False
-            return False
-        nonadmin[chat_id] = True
-        return True
-    return mode
+    chat = await get_chat_settings(chat_id)
+    return chat["nonadmin"]
 
 
 async def add_nonadmin_chat(chat_id: int):
-    nonadmin[chat_id] = True
-    is_admin = await check_nonadmin_chat(chat_id)
-    if is_admin:
+    chat = await get_chat_settings(chat_id)
+    if chat["nonadmin"]:
         return
+    chat["nonadmin"] = True
     return await authdb.insert_one({"chat_id": chat_id})
 
 
 async def remove_nonadmin_chat(chat_id: int):
-    nonadmin[chat_id] = False
-    is_admin = await check_nonadmin_chat(chat_id)
-    if not is_admin:
+    chat = await get_chat_settings(chat_id)
+    if not chat["nonadmin"]:
         return
+    chat["nonadmin"] = False
     return await authdb.delete_one({"chat_id": chat_id})
 
 
 async def is_on_off(on_off: int) -> bool:
-    onoff = await onoffdb.find_one({"on_off": on_off})
-    if not onoff:
-        return False
-    return True
+    if on_off not in onoff:
+        onoff[on_off] = bool(await onoffdb.find_one({"on_off": on_off}))
+    return onoff[on_off]
 
 
 async def add_on(on_off: int):
     is_on = await is_on_off(on_off)
     if is_on:
         return
+    onoff[on_off] = True
     return await onoffdb.insert_one({"on_off": on_off})
 
 
@@ -452,6 +511,7 @@ async def add_off(on_off: int):
     is_off = await is_on_off(on_off)
     if not is_off:
         return
+    onoff[on_off] = False
     return await onoffdb.delete_one({"on_off": on_off})
 
 
@@ -476,89 +536,179 @@ async def is_maintenance():
 async def maintenance_off():
     maintenance.clear()
     maintenance.append(2)
-    is_off = await is_on_off(1)
-    if not is_off:
-        return
-    return await onoffdb.delete_one({"on_off": 1})
+    return await add_off(1)
 
 
 async def maintenance_on():
     maintenance.clear()
     maintenance.append(1)
-    is_on = await is_on_off(1)
-    if is_on:
-        return
-    return await onoffdb.insert_one({"on_off": 1})
+    return await add_on(1)
+
+
+async def load_served():
+    async for user in usersdb.find({"user_id": {"$gt": 0}}, {"_id": 0, "user_id": 1}):
+        servedusers.add(user["user_id"])
+    async for chat in chatsdb.find({"chat_id": {"$lt": 0}}, {"_id": 0, "chat_id": 1}):
+        servedchats.add(chat["chat_id"])
+
+
+async def flush_served():
+    for collection, key, pending in (
+        (usersdb, "user_id", pendingusers),
+        (chatsdb, "chat_id", pendingchats),
+    ):
+        if not pending:
+            continue
+        ids = list(pending)
+        pending.clear()
+        try:
+            await collection.bulk_write(
+                [
+                    UpdateOne({key: item}, {"$setOnInsert": {key: item}}, upsert=True)
+                    for item in ids
+                ],
+                ordered=False,
+            )
+        except Exception:
+            pending.update(ids)
+            raise
+    if pendingseen:
+        pairs = list(pendingseen)
+        pendingseen.clear()
+        try:
+            await seendb.bulk_write(
+                [
+                    UpdateOne(
+                        {"user_id": user_id, "chat_id": chat_id},
+                        {"$setOnInsert": {"user_id": user_id, "chat_id": chat_id}},
+                        upsert=True,
+                    )
+                    for user_id, chat_id in pairs
+                ],
+                ordered=False,
+            )
+        except Exception:
+            pendingseen.update(pairs)
+            raise
+
+
+async def served_flusher():
+    while True:
+        await asyncio.sleep(config.SERVED_FLUSH_INTERVAL)
+        try:
+            await flush_served()
+        except Exception as e:
+            LOGGER(__name__).warning(f"Failed to save served users/chats: {e}")
 
 
 async def is_served_user(user_id: int) -> bool:
-    user = await usersdb.find_one({"user_id": user_id})
-    if not user:
-        return False
-    return True
+    return user_id in servedusers
 
 
 async def get_served_users() -> list:
-    users_list = []
-    async for user in usersdb.find({"user_id": {"$gt": 0}}):
-        users_list.append(user)
-    return users_list
+    return [{"user_id": user_id} for user_id in servedusers]
+
+
+async def get_served_users_count() -> int:
+    return len(servedusers)
 
 
 async def add_served_user(user_id: int):
-    is_served = await is_served_user(user_id)
-    if is_served:
+    if user_id <= 0 or user_id in servedusers:
         return
-    return await usersdb.insert_one({"user_id": user_id})
+    servedusers.add(user_id)
+    pendingusers.add(user_id)
+
+
+async def delete_served_user(user_id: int):
+    servedusers.discard(user_id)
+    pendingusers.discard(user_id)
+    await usersdb.delete_one({"user_id": user_id})
+
+
+async def remove_served_users(user_ids: list):
+    servedusers.difference_update(user_ids)
+    pendingusers.difference_update(user_ids)
+    await usersdb.delete_many({"user_id": {"$in": user_ids}})
 
 
 async def get_served_chats() -> list:
-    chats_list = []
-    async for chat in chatsdb.find({"chat_id": {"$lt": 0}}):
-        chats_list.append(chat)
-    return chats_list
+    return [{"chat_id": chat_id} for chat_id in servedchats]
+
+
+async def get_served_chats_count() -> int:
+    return len(servedchats)
 
 
 async def is_served_chat(chat_id: int) -> bool:
-    chat = await chatsdb.find_one({"chat_id": chat_id})
-    if not chat:
-        return False
-    return True
+    return chat_id in servedchats
 
 
 async def add_served_chat(chat_id: int):
-    is_served = await is_served_chat(chat_id)
-    if is_served:
+    if chat_id >= 0 or chat_id in servedchats:
+        return
+    servedchats.add(chat_id)
+    pendingchats.add(chat_id)
+
+
+async def delete_served_chat(chat_id: int):
+    servedchats.discard(chat_id)
+    pendingchats.discard(chat_id)
+    await chatsdb.delete_one({"chat_id": chat_id})
+
+
+async def remove_served_chats(chat_ids: list):
+    servedchats.difference_update(chat_ids)
+    pendingchats.difference_update(chat_ids)
+    await chatsdb.delete_many({"chat_id": {"$in": chat_ids}})
+
+
+async def add_seen(user_id: int, chat_id: int):
+    pair = (user_id, chat_id)
+    if pair in seenpairs:
         return
-    return await chatsdb.insert_one({"chat_id": chat_id})
+    if len(seenpairs) >= config.SEEN_CACHE_SIZE:
+        seenpairs.clear()
+    seenpairs.add(pair)
+    pendingseen.add(pair)
+
+
+async def get_seen_count(user_id: int) -> int:
+    return await seendb.count_documents({"user_id": user_id})
 
 
 async def blacklisted_chats() -> list:
-    chats_list = []
-    async for chat in blacklist_chatdb.find({"chat_id": {"$lt": 0}}):
-        chats_list.append(chat["chat_id"])
-    return chats_list
+    if "blacklist" not in flags:
+        chats_list = []
+        async for chat in blacklist_chatdb.find({}, {"_id": 0, "chat_id": 1}):
+            chats_list.append(chat["chat_id"])
+        flags["blacklist"] = chats_list
+    return list(flags["blacklist"])
 
 
 async def blacklist_chat(chat_id: int) -> bool:
-    if not await blacklist_chatdb.find_one({"chat_id": chat_id}):
-        await blacklist_chatdb.insert_one({"chat_id": chat_id})
+    if chat_id not in await blacklisted_chats():
+        flags["blacklist"].append(chat_id)
+        await blacklist_chatdb.update_one(
+            {"chat_id": chat_id}, {"$setOnInsert": {"chat_id": chat_id}}, upsert=True
+        )
         return True
     return False
 
 
 async def whitelist_chat(chat_id: int) -> bool:
-    if await blacklist_chatdb.find_one({"chat_id": chat_id}):
+    if chat_id in await blacklisted_chats():
+        flags["blacklist"].remove(chat_id)
         await blacklist_chatdb.delete_one({"chat_id": chat_id})
         return True
     return False
 
 
 async def _get_authusers(chat_id: int) -> Dict[str, int]:
-    _notes = await authuserdb.find_one({"chat_id": chat_id})
-    if not _notes:
-        return {}
-    return _notes["notes"]
+    if chat_id not in authusers:
+        _notes = await authuserdb.find_one({"chat_id": chat_id})
+        authusers[chat_id] = _notes["notes"] if _notes else {}
+    return authusers[chat_id]
 
 
 async def get_authuser_names(chat_id: int) -> List[str]:
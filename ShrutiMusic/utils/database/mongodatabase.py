@@ -20,9 +20,15 @@
 # Email: badboy809075@gmail.com
 
 
+import asyncio
+import time
 from typing import Dict, List, Union
 
+from pymongo import UpdateOne
+
+import config
 from ShrutiMusic.core.mongo import mongodb
+from ShrutiMusic.logging import LOGGER
 
 queriesdb = mongodb.queries
 userdb = mongodb.userstats
@@ -36,8 +42,12 @@ usersdb = mongodb.tgusersdb
 playlistdb = mongodb.playlist
 blockeddb = mongodb.blockedusers
 privatedb = mongodb.privatechats
+playstatsdb = mongodb.playstats
 
 playlist = []
+pendingplays = {}
+playtitles = {}
+toplists = {}
 
 # Playlist
 
@@ -333,94 +343,156 @@ async def set_queries(mode: int):
     )
 
 
-# Top Chats DB
+# Play Stats DB
 
 
-async def get_top_chats() -> dict:
-    results = {}
-    async for chat in chattopdb.find({"chat_id": {"$lt": 0}}):
-        chat_id = chat["chat_id"]
-        total = 0
-        for i in chat["vidid"]:
-            counts_ = chat["vidid"][i]["spot"]
-            if counts_ > 0:
-                total += counts_
-                results[chat_id] = total
-    return results
+async def add_play(chat_id: int, user_id: int, vidid: str, title: str):
+    for key in (("chat", chat_id, vidid), ("user", user_id, vidid)):
+        pendingplays[key] = pendingplays.get(key, 0) + 1
+    playtitles[vidid] = title
 
 
-async def get_global_tops() -> dict:
-    results = {}
-    async for chat in chattopdb.find({"chat_id": {"$lt": 0}}):
-        for i in chat["vidid"]:
-            counts_ = chat["vidid"][i]["spot"]
-            title_ = chat["vidid"][i]["title"]
-            if counts_ > 0:
-                if i not in results:
-                    results[i] = {}
-                    results[i]["spot"] = counts_
-                    results[i]["title"] = title_
-                else:
-                    spot = results[i]["spot"]
-                    count_ = spot + counts_
-                    results[i]["spot"] = count_
-    return results
+async def flush_plays():
+    if not pendingplays:
+        return
+    plays = dict(pendingplays)
+    titles = dict(playtitles)
+    pendingplays.clear()
+    playtitles.clear()
+    try:
+        await playstatsdb.bulk_write(
+            [
+                UpdateOne(
+                    {"scope": scope, "id": _id, "vidid": vidid},
+                    {
+                        "$inc": {"spot": count},
+                        "$set": {"title": titles.get(vidid, vidid)},
+                    },
+                    upsert=True,
+                )
+                for (scope, _id, vidid), count in plays.items()
+            ],
+            ordered=False,
+        )
+    except Exception:
+        for key, count in plays.items():
+            pendingplays[key] = pendingplays.get(key, 0) + count
+        for vidid, title in titles.items():
+            playtitles.setdefault(vidid, title)
+        raise
 
 
-async def get_particulars(chat_id: int) -> Dict[str, int]:
-    ids = await chattopdb.find_one({"chat_id": chat_id})
-    if not ids:
-        return {}
-    return ids["vidid"]
+async def play_flusher():
+    while True:
+        await asyncio.sleep(config.STATS_FLUSH_INTERVAL)
+        try:
+            await flush_plays()
+        except Exception as e:
+            LOGGER(__name__).warning(f"Failed to save play stats: {e}")
 
 
-async def get_particular_top(chat_id: int, name: str) -> Union[bool, dict]:
-    ids = await get_particulars(chat_id)
-    if name in ids:
-        return ids[name]
+async def migrate_plays():
+    if await playstatsdb.estimated_document_count():
+        return
+    ops = []
+    for scope, collection in (("chat", chattopdb), ("user", userdb)):
+        async for doc in collection.find({}):
+            for vidid, entry in doc.get("vidid", {}).items():
+                if entry.get("spot", 0) > 0:
+                    ops.append(
+                        UpdateOne(
+                            {"scope": scope, "id": doc["chat_id"], "vidid": vidid},
+                            {
+                                "$inc": {"spot": entry["spot"]},
+                                "$set": {"title": entry.get("title", vidid)},
+                            },
+                            upsert=True,
+                        )
+                    )
+    if ops:
+        await playstatsdb.bulk_write(ops, ordered=False)
+        LOGGER(__name__).info(f"Migrated {len(ops)} play stats.")
+
+
+async def _leaderboard(name: str, pipeline: list, limit: int) -> list:
+    cached = toplists.get(name)
+    if cached and cached[0] > time.monotonic() and cached[1] >= limit:
+        return cached[2][:limit]
+    rows = await playstatsdb.aggregate(
+        pipeline + [{"$sort": {"spot": -1}}, {"$limit": limit}]
+    ).to_list(length=limit)
+    toplists[name] = (time.monotonic() + config.STATS_CACHE_TTL, limit, rows)
+    return rows
+
+
+async def get_top_chats(limit: int = 10) -> dict:
+    rows = await _leaderboard(
+        "chats",
+        [
+            {"$match": {"scope": "chat", "id": {"$lt": 0}}},
+            {"$group": {"_id": "$id", "spot": {"$sum": "$spot"}}},
+        ],
+        limit,
+    )
+    return {row["_id"]: row["spot"] for row in rows}
+
+
+async def get_global_tops(limit: int = 10) -> dict:
+    rows = await _leaderboard(
+        "tracks",
+        [
+            {"$match": {"scope": "chat", "id": {"$lt": 0}}},
+            {
+                "$group": {
+                    "_id": "$vidid",
+                    "spot": {"$sum": "$spot"},
+                    "title": {"$first": "$title"},
+                }
+            },
+        ],
+        limit,
+    )
+    return {row["_id"]: {"spot": row["spot"], "title": row["title"]} for row in rows}
 
 
-async def update_particular_top(chat_id: int, name: str, vidid: dict):
-    ids = await get_particulars(chat_id)
-    ids[name] = vidid
-    await chattopdb.update_one(
-        {"chat_id": chat_id}, {"$set": {"vidid": ids}}, upsert=True
+async def get_topp_users(limit: int = 10) -> dict:
+    rows = await _leaderboard(
+        "users",
+        [
+            {"$match": {"scope": "user", "id": {"$gt": 0}}},
+            {"$group": {"_id": "$id", "spot": {"$sum": "$spot"}}},
+        ],
+        limit,
     )
+    return {row["_id"]: row["spot"] for row in rows}
 
 
-# Top User DB
+async def _scope_tops(scope: str, _id: int, limit: int) -> Dict[str, dict]:
+    results = {}
+    cursor = playstatsdb.find({"scope": scope, "id": _id}).sort("spot", -1).limit(limit)
+    async for row in cursor:
+        results[row["vidid"]] = {"spot": row["spot"], "title": row["title"]}
+    return results
 
 
-async def get_userss(chat_id: int) -> Dict[str, int]:
-    ids = await userdb.find_one({"chat_id": chat_id})
-    if not ids:
-        return {}
-    return ids["vidid"]
+async def get_particulars(chat_id: int, limit: int = 10) -> Dict[str, dict]:
+    return await _scope_tops("chat", chat_id, limit)
 
 
-async def get_user_top(chat_id: int, name: str) -> Union[bool, dict]:
-    ids = await get_userss(chat_id)
-    if name in ids:
-        return ids[name]
+async def get_particular_top(chat_id: int, name: str) -> Union[bool, dict]:
+    row = await playstatsdb.find_one({"scope": "chat", "id": chat_id, "vidid": name})
+    if row:
+        return {"spot": row["spot"], "title": row["title"]}
 
 
-async def update_user_top(chat_id: int, name: str, vidid: dict):
-    ids = await get_userss(chat_id)
-    ids[name] = vidid
-    await userdb.update_one({"chat_id": chat_id}, {"$set": {"vidid": ids}}, upsert=True)
+async def get_userss(user_id: int, limit: int = 10) -> Dict[str, dict]:
+    return await _scope_tops("user", user_id, limit)
 
 
-async def get_topp_users() -> dict:
-    results = {}
-    async for chat in userdb.find({"chat_id": {"$gt": 0}}):
-        user_id = chat["chat_id"]
-        total = 0
-        for i in chat["vidid"]:
-            counts_ = chat["vidid"][i]["spot"]
-            if counts_ > 0:
-                total += counts_
-        results[user_id] = total
-    return results
+async def get_user_top(user_id: int, name: str) -> Union[bool, dict]:
+    row = await playstatsdb.find_one({"scope": "user", "id": user_id, "vidid": name})
+    if row:
+        return {"spot": row["spot"], "title": row["title"]}
 
 
 # Gban Users
@@ -0,0 +1,225 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+import asyncio
+import secrets
+
+from pyrogram.errors import (
+    ChannelInvalid,
+    ChannelPrivate,
+    ChatAdminRequired,
+    FloodWait,
+    PeerIdInvalid,
+    UserAdminInvalid,
+    UserNotParticipant,
+)
+
+import config
+from ShrutiMusic import LOGGER, app
+from ShrutiMusic.core.mongo import mongodb
+from ShrutiMusic.utils.broadcast import TokenBucket
+from ShrutiMusic.utils.database import flush_served
+from strings import get_string
+
+gbanjobdb = mongodb.gbanjobs
+jobs = {}
+
+SKIP = (
+    ChannelInvalid,
+    ChannelPrivate,
+    ChatAdminRequired,
+    PeerIdInvalid,
+    UserAdminInvalid,
+    UserNotParticipant,
+)
+
+
+class GlobalBan:
+    def __init__(self, doc: dict):
+        self.doc = doc
+        self.bucket = TokenBucket(config.GBAN_RATE)
+        self.semaphore = asyncio.Semaphore(config.GBAN_WORKERS)
+        self.task = None
+
+    def source(self):
+        doc = self.doc
+        query = {"$lt": 0}
+        if doc["cursor"] is not None:
+            query["$gt"] = doc["cursor"]
+        if doc["scope"] == "seen":
+            return mongodb.seen.find(
+                {"user_id": doc["user_id"], "chat_id": query}, {"_id": 0, "chat_id": 1}
+            )
+        return mongodb.chats.find({"chat_id": query}, {"_id": 0, "chat_id": 1})
+
+    async def act(self, chat_id: int):
+        async with self.semaphore:
+            for _ in range(3):
+                await self.bucket.take()
+                try:
+                    if self.doc["action"] == "ban":
+                        await app.ban_chat_member(chat_id, self.doc["user_id"])
+                    else:
+                        await app.unban_chat_member(chat_id, self.doc["user_id"])
+                except FloodWait as e:
+                    self.bucket.flood(int(e.value))
+                    continue
+                except SKIP:
+                    break
+                except Exception:
+                    break
+                self.bucket.success()
+                self.doc["done"] += 1
+                return
+            self.doc["skipped"] += 1
+
+    async def save(self):
+        await gbanjobdb.replace_one({"_id": self.doc["_id"]}, self.doc, upsert=True)
+
+    async def run(self):
+        doc = self.doc
+        batch = []
+        try:
+            async for row in self.source().sort("chat_id", 1):
+                batch.append(row["chat_id"])
+                if len(batch) < config.GBAN_BATCH:
+                    continue
+                await asyncio.gather(*(self.act(chat_id) for chat_id in batch))
+                doc["cursor"] = batch[-1]
+                await self.save()
+                batch = []
+            if batch:
+                await asyncio.gather(*(self.act(chat_id) for chat_id in batch))
+                doc["cursor"] = batch[-1]
+            doc["status"] = "done"
+        except asyncio.CancelledError:
+            doc["status"] = "cancelled"
+            raise
+        except Exception as e:
+            doc["status"] = "failed"
+            LOGGER(__name__).warning(f"Global ban job {doc['_id']} failed: {e}")
+        finally:
+            jobs.pop(doc["_id"], None)
+            await self.save()
+            if doc["status"] == "done":
+                await self.report()
+
+    async def report(self):
+        doc = self.doc
+        _ = get_string(doc["lang"])
+        if doc["action"] == "ban":
+            text = _["gban_6"].format(
+                app.mention,
+                doc["title"],
+                doc["chat_id"],
+                doc["mention"],
+                doc["user_id"],
+                doc["by"],
+                doc["done"],
+            )
+        else:
+            text = _["gban_9"].format(doc["mention"], doc["done"])
+        try:
+            await app.send_message(doc["chat_id"], text)
+            if doc["notice"]:
+                await app.delete_messages(doc["chat_id"], doc["notice"])
+        except Exception:
+            pass
+
+    def start(self):
+        jobs[self.doc["_id"]] = self
+        self.task = asyncio.create_task(self.run())
+
+    async def launch(self):
+        await self.save()
+        self.start()
+
+
+def cancel_user_jobs(user_id: int) -> int:
+    cancelled = 0
+    for job in list(jobs.values()):
+        if job.doc["user_id"] == user_id:
+            job.task.cancel()
+            cancelled += 1
+    return cancelled
+
+
+async def create_gban(
+    action: str,
+    user_id: int,
+    mention: str,
+    by: str,
+    chat_id: int,
+    title: str,
+    lang: str,
+) -> GlobalBan:
+    cancel_user_jobs(user_id)
+    scope = "seen" if config.GBAN_SEEN_ONLY else "all"
+    job = GlobalBan(
+        {
+            "_id": secrets.token_hex(3),
+            "action": action,
+            "user_id": user_id,
+            "mention": mention,
+            "by": by,
+            "chat_id": chat_id,
+            "title": title,
+            "lang": lang,
+            "scope": scope,
+            "total": 0,
+            "cursor": None,
+            "done": 0,
+            "skipped": 0,
+            "notice": None,
+            "status": "running",
+        }
+    )
+    if scope == "seen":
+        try:
+            await flush_served()
+        except Exception as e:
+            LOGGER(__name__).warning(f"Failed to save seen users: {e}")
+        job.doc["total"] = await mongodb.seen.count_documents(
+            {"user_id": user_id, "chat_id": {"$lt": 0}}
+        )
+        if not job.doc["total"]:
+            job.doc["scope"] = "all"
+    if job.doc["scope"] == "all":
+        job.doc["total"] = await mongodb.chats.count_documents({"chat_id": {"$lt": 0}})
+    return job
+
+
+async def resume_gbans():
+    async for doc in gbanjobdb.find({"status": "running"}):
+        GlobalBan(doc).start()
+    if jobs:
+        LOGGER(__name__).info(f"Resumed {len(jobs)} global ban jobs.")
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -0,0 +1,164 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from youtubesearchpython.__future__ import VideosSearch
+
+import config
+from ShrutiMusic.core.mongo import mongodb
+from ShrutiMusic.logging import LOGGER
+
+searchdb = mongodb.searchcache
+
+VIDEO_ID = re.compile(r"(?:v=|youtu\.be/|shorts/|live/)([A-Za-z0-9_-]{11})")
+
+
+class SearchCache:
+    def __init__(self, maxsize: int, ttl: int, persist: bool = False):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.persist = persist
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        entry = self.entries.get(key)
+        if not entry:
+            return None
+        expires, value = entry
+        if expires < time.time():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: list, ttl: int = None):
+        self.entries[key] = (time.time() + (ttl or self.ttl), value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    async def load(self, key: str):
+        if not self.persist:
+            return None
+        try:
+            doc = await searchdb.find_one({"_id": key})
+        except Exception as e:
+            LOGGER(__name__).warning(f"Search cache read failed: {e}")
+            return None
+        if not doc or doc["expires"] < datetime.utcnow():
+            return None
+        ttl = int((doc["expires"] - datetime.utcnow()).total_seconds())
+        self.set(key, doc["result"], ttl)
+        return doc["result"]
+
+    async def store(self, key: str, value: list):
+        if not self.persist:
+            return
+        try:
+            await searchdb.update_one(
+                {"_id": key},
+                {
+                    "$set": {
+                        "result": value,
+                        "expires": datetime.utcnow() + timedelta(seconds=self.ttl),
+                    }
+                },
+                upsert=True,
+            )
+        except Exception as e:
+            LOGGER(__name__).warning(f"Search cache write failed: {e}")
+
+    def stats(self) -> dict:
+        total = self.hits + self.db_hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.db_hits) / total, 3) if total else 0.0,
+        }
+
+
+search_cache = SearchCache(
+    config.SEARCH_CACHE_SIZE,
+    config.SEARCH_CACHE_TTL,
+    config.SEARCH_CACHE_PERSIST,
+)
+
+
+def cache_key(query: str, limit: int = 1) -> str:
+    match = VIDEO_ID.search(query)
+    if match and limit == 1:
+        return f"id:{match.group(1)}"
+    return f"q:{limit}:{' '.join(query.lower().split())}"
+
+
+async def _fetch(key: str, query: str, limit: int) -> list:
+    result = await search_cache.load(key)
+    if result is not None:
+        search_cache.db_hits += 1
+        return result
+    search_cache.misses += 1
+    result = (await VideosSearch(query, limit=limit).next()).get("result") or []
+    if not result:
+        return result
+    search_cache.set(key, result)
+    for item in result:
+        if item.get("id"):
+            search_cache.set(f"id:{item['id']}", [item])
+    await search_cache.store(key, result)
+    return result
+
+
+async def search_videos(query: str, limit: int = 1) -> list:
+    key = cache_key(query, limit)
+    result = search_cache.get(key)
+    if result is not None:
+        search_cache.hits += 1
+        return result
+    task = search_cache.pending.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(key, query, limit))
+        search_cache.pending[key] = task
+        task.add_done_callback(lambda _: search_cache.pending.pop(key, None))
+    return await asyncio.shield(task)
+
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -22,20 +22,23 @@
 
 import os
 
-from config import autoclean
+from ShrutiMusic import Telegram
+from ShrutiMusic.utils.stream.mediacache import media_cache
 
 
 async def auto_clean(popped):
     try:
         rem = popped["file"]
-        autoclean.remove(rem)
-        count = autoclean.count(rem)
-        if count == 0:
-            if "vid_" not in rem or "live_" not in rem or "index_" not in rem:
-                try:
-                    os.remove(rem)
-                except:
-                    pass
+        media_cache.unpin(rem)
+        if media_cache.managed(rem) or media_cache.pinned(rem):
+            return
+        if Telegram.downloading(rem):
+            return
+        if "vid_" not in rem and "live_" not in rem and "index_" not in rem:
+            try:
+                os.remove(rem)
+            except:
+                pass
     except:
         pass
 
@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+import json
+import os
+import time
+
+import config
+
+from ShrutiMusic.logging import LOGGER
+
+CACHE_DIR = "downloads"
+INDEX_FILE = os.path.join(config.TEMP_DB_FOLDER, "mediacache.json")
+MEDIA_EXTS = (".webm", ".mkv", ".mp3", ".m4a", ".mp4", ".ogg", ".opus")
+
+
+class MediaCache:
+    def __init__(self, directory: str, limit: int, policy: str = "lru"):
+        self.directory = directory
+        self.limit = limit
+        self.policy = policy if policy in ("lru", "lfu") else "lru"
+        self.entries = {}
+        self.pins = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load()
+
+    def key(self, file: str) -> str:
+        file = str(file)
+        if file.startswith("vid_"):
+            return file[4:]
+        return os.path.splitext(os.path.basename(file))[0]
+
+    def managed(self, file) -> bool:
+        return str(file) in self.entries
+
+    def load(self):
+        index = {}
+        if os.path.exists(INDEX_FILE):
+            try:
+                with open(INDEX_FILE, "r") as file:
+                    index = json.load(file)
+            except Exception:
+                index = {}
+        for path, entry in index.items():
+            if os.path.isfile(path):
+                entry["size"] = os.path.getsize(path)
+                self.entries[path] = entry
+                self.size += entry["size"]
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                if path in self.entries or not name.endswith(MEDIA_EXTS):
+                    continue
+                if not os.path.isfile(path):
+                    continue
+                stat = os.stat(path)
+                self.entries[path] = {
+                    "size": stat.st_size,
+                    "hits": 0,
+                    "atime": stat.st_mtime,
+                }
+                self.size += stat.st_size
+        LOGGER(__name__).info(
+            f"Media cache loaded with {len(self.entries)} files ({self.size} bytes)."
+        )
+        self.evict()
+
+    def save(self):
+        os.makedirs(os.path.dirname(INDEX_FILE), exist_ok=True)
+        temp = f"{INDEX_FILE}.tmp"
+        with open(temp, "w") as file:
+            json.dump(self.entries, file)
+        os.replace(temp, INDEX_FILE)
+
+    def lookup(self, path: str) -> bool:
+        entry = self.entries.get(path)
+        if entry and os.path.isfile(path):
+            entry["hits"] += 1
+            entry["atime"] = time.time()
+            self.hits += 1
+            return True
+        if entry:
+            self.size -= entry["size"]
+            del self.entries[path]
+        self.misses += 1
+        return False
+
+    def add(self, path: str):
+        old = self.entries.pop(path, None)
+        if old:
+            self.size -= old["size"]
+        size = os.path.getsize(path)
+        self.entries[path] = {
+            "size": size,
+            "hits": old["hits"] if old else 0,
+            "atime": time.time(),
+        }
+        self.size += size
+        self.evict(keep=path)
+        self.save()
+
+    def pin(self, file):
+        key = self.key(file)
+        self.pins[key] = self.pins.get(key, 0) + 1
+
+    def unpin(self, file):
+        key = self.key(file)
+        count = self.pins.get(key, 0) - 1
+        if count > 0:
+            self.pins[key] = count
+        else:
+            self.pins.pop(key, None)
+
+    def pinned(self, file) -> bool:
+        return self.key(file) in self.pins
+
+    def evict(self, keep: str = None):
+        if self.size <= self.limit:
+            return
+        if self.policy == "lfu":
+            order = lambda item: (item[1]["hits"], item[1]["atime"])
+        else:
+            order = lambda item: item[1]["atime"]
+        candidates = sorted(
+            (
+                item
+                for item in self.entries.items()
+                if item[0] != keep and not self.pinned(item[0])
+            ),
+            key=order,
+        )
+        removed = False
+        for path, entry in candidates:
+            if self.size <= self.limit:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                LOGGER(__name__).warning(f"Failed to evict {path}: {e}")
+                continue
+            del self.entries[path]
+            self.size -= entry["size"]
+            self.evictions += 1
+            removed = True
+        if removed:
+            self.save()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "files": len(self.entries),
+            "size": self.size,
+            "limit": self.limit,
+            "pinned": len(self.pins),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+media_cache = MediaCache(CACHE_DIR, config.MEDIA_CACHE_LIMIT, config.MEDIA_CACHE_POLICY)
+
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -0,0 +1,69 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+import time
+
+
+def start_position(entry: dict, played: int = 0):
+    entry["played"] = played
+    entry["anchor"] = time.monotonic()
+
+
+def _position(entry: dict) -> float:
+    played = entry["played"]
+    anchor = entry.get("anchor")
+    duration = int(entry["seconds"])
+    if anchor is None or duration == 0:
+        return played
+    return min(played + time.monotonic() - anchor, duration)
+
+
+def get_played(entry: dict) -> int:
+    return int(_position(entry))
+
+
+def set_played(entry: dict, played: int):
+    entry["played"] = max(played, 0)
+    if entry.get("anchor") is not None:
+        entry["anchor"] = time.monotonic()
+
+
+def pause_position(entry: dict):
+    entry["played"] = _position(entry)
+    entry["anchor"] = None
+
+
+def resume_position(entry: dict):
+    if entry.get("anchor") is None:
+        entry["anchor"] = time.monotonic()
+
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -0,0 +1,92 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+import asyncio
+import os
+from itertools import islice
+
+import config
+from ShrutiMusic import YouTube
+from ShrutiMusic.logging import LOGGER
+from ShrutiMusic.misc import db
+from ShrutiMusic.utils.stream.mediacache import media_cache
+
+prefetching = {}
+semaphore = asyncio.Semaphore(config.PREFETCH_WORKERS)
+
+
+def prefetch_path(vidid: str, video: bool) -> str:
+    return os.path.join("downloads", f"{vidid}.{'mkv' if video else 'webm'}")
+
+
+def is_prefetched(vidid: str, video: bool) -> bool:
+    path = prefetch_path(vidid, video)
+    return media_cache.managed(path) and os.path.isfile(path)
+
+
+async def _prefetch(vidid: str, video: bool):
+    async with semaphore:
+        if is_prefetched(vidid, video):
+            return
+        try:
+            await YouTube.download(vidid, None, videoid=True, video=video, prefetch=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            LOGGER(__name__).warning(f"Prefetch failed for {vidid}: {e}")
+
+
+def schedule_prefetch(chat_id: int):
+    if not config.PREFETCH_DEPTH:
+        return
+    wanted = []
+    for entry in islice(db.get(chat_id) or (), 1, 1 + config.PREFETCH_DEPTH):
+        if "vid_" in str(entry["file"]):
+            wanted.append((entry["vidid"], str(entry["streamtype"]) == "video"))
+    tasks = prefetching.setdefault(chat_id, {})
+    for key in list(tasks):
+        if key not in wanted or tasks[key].done():
+            task = tasks.pop(key)
+            if key not in wanted:
+                task.cancel()
+    for key in wanted:
+        if key not in tasks and not is_prefetched(*key):
+            tasks[key] = asyncio.create_task(_prefetch(*key))
+    if not tasks:
+        prefetching.pop(chat_id, None)
+
+
+def cancel_prefetch(chat_id: int):
+    for task in prefetching.pop(chat_id, {}).values():
+        task.cancel()
+
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
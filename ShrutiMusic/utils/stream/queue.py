@@ -20,12 +20,110 @@
 # Email: badboy809075@gmail.com
 
 
-import asyncio
+import random
+from collections import deque
+from itertools import islice
 from typing import Union
 
+import config
+from ShrutiMusic.core.executor import io_pool
 from ShrutiMusic.misc import db
+from ShrutiMusic.utils.database import add_play
+from ShrutiMusic.utils.exceptions import AssistantErr
 from ShrutiMusic.utils.formatters import check_duration, seconds_to_min
-from config import autoclean, time_to_seconds
+from ShrutiMusic.utils.stream.mediacache import media_cache
+from ShrutiMusic.utils.stream.position import start_position
+from ShrutiMusic.utils.stream.prefetch import schedule_prefetch
+from config import time_to_seconds
+
+
+class Track:
+    __slots__ = (
+        "title",
+        "dur",
+        "streamtype",
+        "by",
+        "user_id",
+        "chat_id",
+        "file",
+        "vidid",
+        "seconds",
+        "played",
+        "anchor",
+        "mystic",
+        "markup",
+        "speed_path",
+        "speed",
+        "old_dur",
+        "old_second",
+    )
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            setattr(self, key, value)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class Queue(deque):
+    def pop(self, index: int = -1):
+        if index == 0:
+            return self.popleft()
+        if index == -1:
+            return super().pop()
+        track = self[index]
+        del self[index]
+        return track
+
+    def drop(self, count: int) -> list:
+        return [self.popleft() for _ in range(min(count, len(self)))]
+
+    def move(self, old: int, new: int):
+        track = self[old]
+        del self[old]
+        self.insert(new, track)
+
+    def shuffle(self, start: int = 0):
+        tracks = list(islice(self, start, None))
+        random.shuffle(tracks)
+        for _ in tracks:
+            super().pop()
+        self.extend(tracks)
+
+    @property
+    def full(self) -> bool:
+        return bool(config.QUEUE_LIMIT) and len(self) >= config.QUEUE_LIMIT
+
+
+def is_queue_full(chat_id: int) -> bool:
+    check = db.get(chat_id)
+    return bool(check) and check.full
+
+
+def _push(chat_id: int, put: Track, forceplay):
+    check = db.get(chat_id)
+    if check is None:
+        check = db[chat_id] = Queue()
+    if forceplay:
+        check.appendleft(put)
+    elif check.full:
+        raise AssistantErr(
+            f"You can't add more than {config.QUEUE_LIMIT} songs to the queue."
+        )
+    else:
+        check.append(put)
+    if check[0] is put:
+        start_position(put)
 
 
 async def put_queue(
@@ -45,28 +143,24 @@ async def put_queue(
         duration_in_seconds = time_to_seconds(duration) - 3
     except:
         duration_in_seconds = 0
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "user_id": user_id,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": duration_in_seconds,
-        "played": 0,
-    }
-    if forceplay:
-        check = db.get(chat_id)
-        if check:
-            check.insert(0, put)
-        else:
-            db[chat_id] = []
-            db[chat_id].append(put)
-    else:
-        db[chat_id].append(put)
-    autoclean.append(file)
+    put = Track(
+        title=title,
+        dur=duration,
+        streamtype=stream,
+        by=user,
+        user_id=user_id,
+        chat_id=original_chat_id,
+        file=file,
+        vidid=vidid,
+        seconds=duration_in_seconds,
+        played=0,
+        anchor=None,
+    )
+    _push(chat_id, put, forceplay)
+    if vidid not in ("soundcloud", "telegram"):
+        await add_play(original_chat_id, user_id, vidid, title)
+    media_cache.pin(file)
+    schedule_prefetch(chat_id)
 
 
 async def put_queue_index(
@@ -82,35 +176,26 @@ async def put_queue_index(
 ):
     if "20.212.146.162" in vidid:
         try:
-            dur = await asyncio.get_event_loop().run_in_executor(
-                None, check_duration, vidid
-            )
+            dur = await io_pool.run(check_duration, vidid)
             duration = seconds_to_min(dur)
         except:
             duration = "ᴜʀʟ sᴛʀᴇᴀᴍ"
             dur = 0
     else:
         dur = 0
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": dur,
-        "played": 0,
-    }
-    if forceplay:
-        check = db.get(chat_id)
-        if check:
-            check.insert(0, put)
-        else:
-            db[chat_id] = []
-            db[chat_id].append(put)
-    else:
-        db[chat_id].append(put)
+    put = Track(
+        title=title,
+        dur=duration,
+        streamtype=stream,
+        by=user,
+        chat_id=original_chat_id,
+        file=file,
+        vidid=vidid,
+        seconds=dur,
+        played=0,
+        anchor=None,
+    )
+    _push(chat_id, put, forceplay)
 
 
 # ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
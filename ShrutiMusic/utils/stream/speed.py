@@ -0,0 +1,137 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+
+import asyncio
+import os
+
+import config
+from ShrutiMusic.core.executor import io_pool
+from ShrutiMusic.logging import LOGGER
+from ShrutiMusic.misc import db
+
+playback = os.path.join(os.getcwd(), "playback")
+rendering = {}
+semaphore = asyncio.Semaphore(config.SPEED_RENDER_WORKERS)
+
+
+def tempo_parameters(speed, start: int, source: str = "") -> str:
+    scale = round(1 / float(speed), 4)
+    return (
+        f"--audio {source} -ss {start} -atmid -filter:a atempo={speed} "
+        f"--video {source} -ss {start} -itsscale {scale}"
+    )
+
+
+def render_path(file_path: str, speed) -> str:
+    return os.path.join(playback, str(speed), os.path.basename(file_path))
+
+
+def rendered(file_path: str, speed):
+    path = render_path(file_path, speed)
+    if not os.path.isfile(path):
+        return None
+    os.utime(path)
+    return path
+
+
+def _evict(busy: set):
+    files = []
+    for root, _, names in os.walk(playback):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    limit = config.SPEED_CACHE_SIZE * 1024 * 1024
+    for _, size, path in sorted(files):
+        if total <= limit:
+            break
+        if path in busy:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+async def _render(file_path: str, speed):
+    out = render_path(file_path, speed)
+    root, ext = os.path.splitext(out)
+    temp = f"{root}.part{ext}"
+    async with semaphore:
+        if os.path.isfile(out) or not os.path.isfile(file_path):
+            return
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-y",
+            "-i",
+            file_path,
+            "-filter:v",
+            f"setpts={round(1 / float(speed), 4)}*PTS",
+            "-filter:a",
+            f"atempo={speed}",
+            temp,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            code = await proc.wait()
+        except asyncio.CancelledError:
+            proc.kill()
+            raise
+        finally:
+            if proc.returncode != 0 and os.path.isfile(temp):
+                os.remove(temp)
+        if code != 0:
+            LOGGER(__name__).warning(f"Speed render failed for {file_path} at {speed}x")
+            return
+        os.replace(temp, out)
+    busy = {
+        entry.get("speed_path") for queue in db.values() for entry in queue
+    }
+    await io_pool.run(_evict, busy)
+
+
+def render(file_path: str, speed):
+    key = (file_path, str(speed))
+    if key not in rendering:
+        task = asyncio.create_task(_render(file_path, speed))
+        task.add_done_callback(lambda _: rendering.pop(key, None))
+        rendering[key] = task
+    return rendering[key]
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -0,0 +1,175 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+
+import asyncio
+
+from pymongo import DeleteOne, ReplaceOne
+
+import config
+from ShrutiMusic import YouTube
+from ShrutiMusic.core.call import Nand
+from ShrutiMusic.core.mongo import mongodb
+from ShrutiMusic.logging import LOGGER
+from ShrutiMusic.misc import db
+from ShrutiMusic.utils.formatters import seconds_to_min
+from ShrutiMusic.utils.stream.mediacache import media_cache
+from ShrutiMusic.utils.stream.position import get_played, set_played, start_position
+from ShrutiMusic.utils.stream.prefetch import schedule_prefetch
+from ShrutiMusic.utils.stream.queue import Queue, Track
+
+queuedb = mongodb.queues
+
+FIELDS = (
+    "title",
+    "dur",
+    "streamtype",
+    "by",
+    "user_id",
+    "chat_id",
+    "file",
+    "vidid",
+    "seconds",
+)
+
+saved = {}
+
+
+def _snapshot(queue: list) -> list:
+    tracks = []
+    for index, entry in enumerate(queue):
+        track = {key: entry.get(key) for key in FIELDS}
+        track["played"] = 0
+        if index == 0:
+            track["played"] = int(get_played(entry) * float(entry.get("speed") or 1.0))
+        if entry.get("old_dur"):
+            track["dur"] = entry["old_dur"]
+            track["seconds"] = entry["old_second"]
+        tracks.append(track)
+    return tracks
+
+
+async def flush_queues():
+    ops = []
+    written = {}
+    for chat_id, queue in list(db.items()):
+        if not queue:
+            continue
+        tracks = _snapshot(queue)
+        if saved.get(chat_id) != tracks:
+            ops.append(ReplaceOne({"_id": chat_id}, {"queue": tracks}, upsert=True))
+        written[chat_id] = tracks
+    for chat_id in saved:
+        if chat_id not in written:
+            ops.append(DeleteOne({"_id": chat_id}))
+    if ops:
+        await queuedb.bulk_write(ops, ordered=False)
+    saved.clear()
+    saved.update(written)
+
+
+async def queue_saver():
+    while True:
+        await asyncio.sleep(config.QUEUE_SAVE_INTERVAL)
+        try:
+            await flush_queues()
+        except Exception as e:
+            LOGGER(__name__).warning(f"Failed to save queues: {e}")
+
+
+async def _resume(chat_id: int):
+    entry = db[chat_id][0]
+    queued = entry["file"]
+    video = entry["streamtype"] == "video"
+    if "live_" in queued:
+        n, file_path = await YouTube.video(entry["vidid"], True)
+        if n == 0:
+            raise Exception("live stream is no longer available")
+    elif "vid_" in queued:
+        file_path, direct = await YouTube.download(
+            entry["vidid"], None, videoid=True, video=video
+        )
+    elif "index_" in queued:
+        file_path = entry["vidid"]
+    else:
+        file_path = queued
+    played = entry["played"]
+    await Nand.join_call(chat_id, entry["chat_id"], file_path, video=video or None)
+    start_position(entry)
+    duration = int(entry["seconds"])
+    if played and duration > played + 10:
+        await Nand.seek_stream(
+            chat_id,
+            file_path,
+            seconds_to_min(played),
+            entry["dur"],
+            entry["streamtype"],
+        )
+        set_played(entry, played)
+
+
+async def _restore(chat_id: int, tracks: list, semaphore: asyncio.Semaphore):
+    queue = db[chat_id] = Queue(Track(**track, anchor=None) for track in tracks)
+    for track in queue:
+        media_cache.pin(track["file"])
+    async with semaphore:
+        try:
+            await asyncio.wait_for(_resume(chat_id), config.QUEUE_RESTORE_TIMEOUT)
+        except Exception as e:
+            reason = "timed out" if isinstance(e, asyncio.TimeoutError) else e
+            LOGGER(__name__).warning(f"Could not resume queue in {chat_id}: {reason}")
+            for track in queue:
+                media_cache.unpin(track["file"])
+            if db.get(chat_id) is queue:
+                db[chat_id] = Queue()
+            return
+    saved[chat_id] = _snapshot(queue)
+    schedule_prefetch(chat_id)
+
+
+async def restore_queues():
+    semaphore = asyncio.Semaphore(config.QUEUE_RESTORE_WORKERS)
+    tasks = []
+    try:
+        async for document in queuedb.find({}):
+            tracks = document.get("queue") or []
+            if tracks:
+                tasks.append(_restore(document["_id"], tracks, semaphore))
+        await asyncio.gather(*tasks)
+        restored = [chat_id for chat_id in saved]
+        await queuedb.delete_many({"_id": {"$nin": restored}})
+    except Exception as e:
+        LOGGER(__name__).warning(f"Failed to restore queues: {e}")
+        return
+    if restored:
+        LOGGER(__name__).info(f"Resumed playback in {len(restored)} chats.")
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
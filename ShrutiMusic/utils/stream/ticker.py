@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Nand Yaduwanshi <NoxxOP>
+# Location: Supaul, Bihar
+#
+# All rights reserved.
+#
+# This code is the intellectual property of Nand Yaduwanshi.
+# You are not allowed to copy, modify, redistribute, or use this
+# code for commercial or personal projects without explicit permission.
+#
+# Allowed:
+# - Forking for personal learning
+# - Submitting improvements via pull requests
+#
+# Not Allowed:
+# - Claiming this code as your own
+# - Re-uploading without credit or permission
+# - Selling or using commercially
+#
+# Contact for permissions:
+# Email: badboy809075@gmail.com
+
+
+
+import asyncio
+import time
+
+from pyrogram.errors import FloodWait, MessageNotModified
+
+import config
+from ShrutiMusic.logging import LOGGER
+from ShrutiMusic.misc import db
+from ShrutiMusic.utils.database import is_active_chat, is_music_playing
+from ShrutiMusic.utils.formatters import seconds_to_min
+from ShrutiMusic.utils.inline import queue_markup
+from ShrutiMusic.utils.stream.position import get_played
+
+players = {}
+ticker = None
+backoff = 0.0
+
+
+def track_player(chat_id: int, message, _, cplay: str, videoid: str):
+    chat = players.setdefault(chat_id, {})
+    chat.pop(message.id, None)
+    chat[message.id] = {
+        "message": message,
+        "_": _,
+        "cplay": cplay,
+        "videoid": videoid,
+        "due": time.monotonic() + config.PLAYER_UPDATE_INTERVAL,
+        "last": None,
+    }
+    while len(chat) > config.PLAYER_LIMIT:
+        chat.pop(next(iter(chat)))
+    global ticker
+    if ticker is None or ticker.done():
+        ticker = asyncio.create_task(_tick())
+
+
+def retire_player(chat_id: int, message_id: int):
+    chat = players.get(chat_id)
+    if chat:
+        chat.pop(message_id, None)
+        if not chat:
+            players.pop(chat_id, None)
+
+
+async def _due(now: float, interval: float) -> list:
+    edits = []
+    for chat_id in list(players):
+        chat = players.get(chat_id)
+        queue = db.get(chat_id)
+        if not chat:
+            continue
+        if not queue or not await is_active_chat(chat_id):
+            players.pop(chat_id, None)
+            continue
+        entry = queue[0]
+        for message_id, player in list(chat.items()):
+            if player["videoid"] != entry["vidid"]:
+                chat.pop(message_id)
+        if not chat:
+            players.pop(chat_id, None)
+            continue
+        if not await is_music_playing(chat_id):
+            continue
+        played = seconds_to_min(get_played(entry))
+        for message_id, player in chat.items():
+            if player["due"] > now or player["last"] == played:
+                continue
+            player["due"] = now + interval
+            edits.append((chat_id, message_id, player, played, entry["dur"]))
+    return edits
+
+
+async def _tick():
+    global backoff
+    while players:
+        await asyncio.sleep(1)
+        now = time.monotonic()
+        if now < backoff:
+            continue
+        total = sum(len(chat) for chat in players.values())
+        interval = max(
+            config.PLAYER_UPDATE_INTERVAL, total / config.PLAYER_EDIT_BUDGET
+        )
+        for chat_id, message_id, player, played, dur in await _due(now, interval):
+            buttons = queue_markup(
+                player["_"],
+                "Inline",
+                player["cplay"],
+                player["videoid"],
+                played,
+                dur,
+            )
+            try:
+                await player["message"].edit_reply_markup(reply_markup=buttons)
+                player["last"] = played
+            except MessageNotModified:
+                player["last"] = played
+            except FloodWait as e:
+                backoff = time.monotonic() + e.value
+                LOGGER(__name__).warning(
+                    f"Player updates paused for {e.value}s by FloodWait"
+                )
+                break
+            except Exception:
+                retire_player(chat_id, message_id)
+
+# ©️ Copyright Reserved - @NoxxOP  Nand Yaduwanshi
+
+# ===========================================
+# ©️ 2025 Nand Yaduwanshi (aka @NoxxOP)
+# 🔗 GitHub : https://github.com/NoxxOP/ShrutiMusic
+# 📢 Telegram Channel : https://t.me/ShrutiBots
+# ===========================================
+
+
+# ❤️ Love From ShrutiBots 
@@ -22,16 +22,23 @@
 # ATLEAST GIVE CREDITS IF YOU STEALING :
 # ELSE NO FURTHER PUBLIC THUMBNAIL UPDATES
 
+import asyncio
 import os
-import aiohttp
-import aiofiles
 import traceback
+import uuid
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageEnhance
-from youtubesearchpython.__future__ import VideosSearch
+
+import config
+from ShrutiMusic.core.executor import cpu_pool
+from ShrutiMusic.core.http import http
+from ShrutiMusic.utils.searchcache import search_videos
 
 CACHE_DIR = Path("cache")
 CACHE_DIR.mkdir(exist_ok=True)
+rendering = {}
 
 CANVAS_W, CANVAS_H = 1320, 760
 BG_BLUR = 16
@@ -47,9 +54,39 @@ TEXT_SHADOW = (0, 0, 0, 140)
 FONT_REGULAR_PATH = "ShrutiMusic/assets/font2.ttf"
 FONT_BOLD_PATH    = "ShrutiMusic/assets/font3.ttf"
 
+
+@lru_cache(maxsize=64)
+def load_font(path, size):
+    return ImageFont.truetype(path, size)
+
+
 # Default small-size loaded fonts (can reuse directly)
-FONT_REGULAR = ImageFont.truetype(FONT_REGULAR_PATH, 30)
-FONT_BOLD    = ImageFont.truetype(FONT_BOLD_PATH, 30)
+FONT_REGULAR = load_font(FONT_REGULAR_PATH, 30)
+FONT_BOLD    = load_font(FONT_BOLD_PATH, 30)
+
+# Output format of rendered cards: png, jpeg or webp
+THUMB_FORMAT = config.THUMB_FORMAT if config.THUMB_FORMAT in ("png", "jpeg", "webp") else "jpeg"
+THUMB_EXT = {"png": "png", "jpeg": "jpg", "webp": "webp"}[THUMB_FORMAT]
+
+# circular artwork geometry, built once
+THUMB_SIZE = 470
+RING_WIDTH = 20
+
+
+def build_artwork_layers():
+    circular_mask = Image.new("L", (THUMB_SIZE, THUMB_SIZE), 0)
+    mdraw = ImageDraw.Draw(circular_mask)
+    mdraw.ellipse((0, 0, THUMB_SIZE, THUMB_SIZE), fill=255)
+
+    ring_size = THUMB_SIZE + RING_WIDTH * 2
+    ring_img = Image.new("RGBA", (ring_size, ring_size), (0, 0, 0, 0))
+    rdraw = ImageDraw.Draw(ring_img)
+    ring_bbox = (RING_WIDTH//2, RING_WIDTH//2, ring_size - RING_WIDTH//2, ring_size - RING_WIDTH//2)
+    rdraw.ellipse(ring_bbox, outline=RING_COLOR, width=RING_WIDTH)
+    return circular_mask, ring_img
+
+
+CIRCULAR_MASK, RING_IMG = build_artwork_layers()
 
 
 def change_image_size(max_w, max_h, image):
@@ -81,7 +118,7 @@ def fit_title_two_lines(draw, text, max_width, font_path, start_size=58, min_siz
     size = start_size
     while size >= min_size:
         try:
-            f = ImageFont.truetype(font_path, size)
+            f = load_font(font_path, size)
         except:
             size -= 1
             continue
@@ -90,15 +127,131 @@ def fit_title_two_lines(draw, text, max_width, font_path, start_size=58, min_siz
         if len(lines) <= 2 and all(draw.textlength(l, font=f) <= max_width for l in lines):
             return f, wrapped
         size -= 1
-    f = ImageFont.truetype(font_path, min_size)
+    f = load_font(font_path, min_size)
     return f, wrap_two_lines(draw, text, f, max_width)
 
 
+def thumb_path(videoid: str) -> Path:
+    return CACHE_DIR / f"{videoid}_styled.{THUMB_EXT}"
+
+
+def evict_thumbs():
+    cards = []
+    for path in CACHE_DIR.glob("*_styled.*"):
+        try:
+            cards.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    cards.sort(key=lambda card: card[0])
+    for _, path in cards[: max(0, len(cards) - config.THUMB_CACHE_LIMIT)]:
+        try:
+            path.unlink()
+        except:
+            pass
+
+
+def render_thumb(image_bytes, title, duration, views, channel, out):
+    base_img = Image.open(BytesIO(image_bytes)).convert("RGBA")
+
+    # Background
+    bg = change_image_size(CANVAS_W, CANVAS_H, base_img).convert("RGBA")
+    bg = bg.filter(ImageFilter.GaussianBlur(BG_BLUR))
+    bg = ImageEnhance.Brightness(bg).enhance(BG_BRIGHTNESS)
+
+    canvas = Image.new("RGBA", (CANVAS_W, CANVAS_H), (0, 0, 0, 255))
+    canvas.paste(bg, (0, 0))
+    draw = ImageDraw.Draw(canvas)
+
+    # outer lime frame
+    frame_inset = 12
+    draw.rectangle(
+        [frame_inset//2, frame_inset//2, CANVAS_W - frame_inset//2, CANVAS_H - frame_inset//2],
+        outline=LIME_BORDER, width=frame_inset
+    )
+
+    # circular artwork
+    circle_x = 92
+    circle_y = (CANVAS_H - THUMB_SIZE) // 2
+
+    art = base_img.resize((THUMB_SIZE, THUMB_SIZE))
+    art.putalpha(CIRCULAR_MASK)
+
+    canvas.paste(RING_IMG, (circle_x - RING_WIDTH, circle_y - RING_WIDTH), RING_IMG)
+    canvas.paste(art, (circle_x, circle_y), art)
+
+    # top-left label
+    tl_font = load_font(FONT_BOLD_PATH, 34)
+    draw.text((28+1, 18+1), "ShrutiMusic", fill=TEXT_SHADOW, font=tl_font)
+    draw.text((28, 18), "ShrutiMusic", fill=TEXT_WHITE, font=tl_font)
+
+    # right text block
+    info_x = circle_x + THUMB_SIZE + 60
+    max_text_w = CANVAS_W - info_x - 48
+
+    # NOW PLAYING
+    np_font = load_font(FONT_BOLD_PATH, 60)
+    np_text = "NOW PLAYING"
+    np_w = draw.textlength(np_text, font=np_font)
+    np_x = info_x + (max_text_w - np_w) // 2 - 95
+    np_y = circle_y + 30  
+    draw.text((np_x+2, np_y+2), np_text, fill=TEXT_SHADOW, font=np_font)
+    draw.text((np_x, np_y), np_text, fill=TEXT_WHITE, font=np_font)
+
+    # TITLE
+    title_font, title_wrapped = fit_title_two_lines(draw, title, max_text_w, FONT_BOLD_PATH, start_size=30, min_size=30)
+    title_y = np_y + 110   
+    draw.multiline_text((info_x+2, title_y+2), title_wrapped, fill=TEXT_SHADOW, font=title_font, spacing=8)
+    draw.multiline_text((info_x, title_y),     title_wrapped, fill=TEXT_WHITE,  font=title_font, spacing=8)
+
+    # Meta lines
+    meta_font = load_font(FONT_REGULAR_PATH, 30)
+    line_gap = 46
+    meta_start_y = title_y + 130  
+    duration_label = duration
+    if duration and ":" in duration and "Min" not in duration and "min" not in duration:
+        duration_label = f"{duration} Mins"
+
+    def draw_meta(y, text):
+        draw.text((info_x+1, y+1), text, fill=TEXT_SHADOW, font=meta_font)
+        draw.text((info_x,   y),   text, fill=TEXT_SOFT,  font=meta_font)
+
+    draw_meta(meta_start_y + 0 * line_gap, f"Views : {views}")
+    draw_meta(meta_start_y + 1 * line_gap, f"Duration : {duration_label}")
+    draw_meta(meta_start_y + 2 * line_gap, f"Channel : {channel}")
+
+    temp = out.with_name(f"{uuid.uuid4().hex}.render")
+    try:
+        if THUMB_FORMAT == "png":
+            canvas.save(temp, format="PNG")
+        else:
+            canvas.convert("RGB").save(temp, format=THUMB_FORMAT.upper(), quality=88)
+        os.replace(temp, out)
+    except:
+        temp.unlink(missing_ok=True)
+        raise
+    evict_thumbs()
+
+
 async def gen_thumb(videoid: str):
+    out = thumb_path(videoid)
+    if out.exists():
+        try:
+            os.utime(out)
+        except:
+            pass
+        return str(out)
+
+    task = rendering.get(videoid)
+    if task is None:
+        task = rendering[videoid] = asyncio.ensure_future(_gen_thumb(videoid, out))
+        task.add_done_callback(lambda _: rendering.pop(videoid, None))
+    return await asyncio.shield(task)
+
+
+async def _gen_thumb(videoid: str, out: Path):
     url = f"https://www.youtube.com/watch?v={videoid}"
     try:
-        results = VideosSearch(url, limit=1)
-        result = (await results.next())["result"][0]
+        result = (await search_videos(url))[0]
 
         title    = result.get("title", "Unknown Title")
         duration = result.get("duration", "Unknown")
@@ -106,101 +259,14 @@ async def gen_thumb(videoid: str):
         views    = result.get("viewCount", {}).get("short", "Unknown Views")
         channel  = result.get("channel", {}).get("name", "Unknown Channel")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(thumburl) as resp:
-                if resp.status == 200:
-                    thumb_path = CACHE_DIR / f"thumb{videoid}.png"
-                    async with aiofiles.open(thumb_path, "wb") as f:
-                        await f.write(await resp.read())
-
-        base_img = Image.open(thumb_path).convert("RGBA")
-
-        # Background
-        bg = change_image_size(CANVAS_W, CANVAS_H, base_img).convert("RGBA")
-        bg = bg.filter(ImageFilter.GaussianBlur(BG_BLUR))
-        bg = ImageEnhance.Brightness(bg).enhance(BG_BRIGHTNESS)
-
-        canvas = Image.new("RGBA", (CANVAS_W, CANVAS_H), (0, 0, 0, 255))
-        canvas.paste(bg, (0, 0))
-        draw = ImageDraw.Draw(canvas)
-
-        # outer lime frame
-        frame_inset = 12
-        draw.rectangle(
-            [frame_inset//2, frame_inset//2, CANVAS_W - frame_inset//2, CANVAS_H - frame_inset//2],
-            outline=LIME_BORDER, width=frame_inset
-        )
-
-        # circular artwork
-        thumb_size = 470
-        ring_width = 20
-        circle_x = 92
-        circle_y = (CANVAS_H - thumb_size) // 2
-
-        circular_mask = Image.new("L", (thumb_size, thumb_size), 0)
-        mdraw = ImageDraw.Draw(circular_mask)
-        mdraw.ellipse((0, 0, thumb_size, thumb_size), fill=255)
-
-        art = base_img.resize((thumb_size, thumb_size))
-        art.putalpha(circular_mask)
-
-        ring_size = thumb_size + ring_width * 2
-        ring_img = Image.new("RGBA", (ring_size, ring_size), (0, 0, 0, 0))
-        rdraw = ImageDraw.Draw(ring_img)
-        ring_bbox = (ring_width//2, ring_width//2, ring_size - ring_width//2, ring_size - ring_width//2)
-        rdraw.ellipse(ring_bbox, outline=RING_COLOR, width=ring_width)
-
-        canvas.paste(ring_img, (circle_x - ring_width, circle_y - ring_width), ring_img)
-        canvas.paste(art, (circle_x, circle_y), art)
-
-        # top-left label
-        tl_font = ImageFont.truetype(FONT_BOLD_PATH, 34)
-        draw.text((28+1, 18+1), "ShrutiMusic", fill=TEXT_SHADOW, font=tl_font)
-        draw.text((28, 18), "ShrutiMusic", fill=TEXT_WHITE, font=tl_font)
-
-        # right text block
-        info_x = circle_x + thumb_size + 60
-        max_text_w = CANVAS_W - info_x - 48
-
-        # NOW PLAYING
-        np_font = ImageFont.truetype(FONT_BOLD_PATH, 60)
-        np_text = "NOW PLAYING"
-        np_w = draw.textlength(np_text, font=np_font)
-        np_x = info_x + (max_text_w - np_w) // 2 - 95
-        np_y = circle_y + 30  
-        draw.text((np_x+2, np_y+2), np_text, fill=TEXT_SHADOW, font=np_font)
-        draw.text((np_x, np_y), np_text, fill=TEXT_WHITE, font=np_font)
-
-        # TITLE
-        title_font, title_wrapped = fit_title_two_lines(draw, title, max_text_w, FONT_BOLD_PATH, start_size=30, min_size=30)
-        title_y = np_y + 110   
-        draw.multiline_text((info_x+2, title_y+2), title_wrapped, fill=TEXT_SHADOW, font=title_font, spacing=8)
-        draw.multiline_text((info_x, title_y),     title_wrapped, fill=TEXT_WHITE,  font=title_font, spacing=8)
-
-        # Meta lines
-        meta_font = ImageFont.truetype(FONT_REGULAR_PATH, 30)
-        line_gap = 46
-        meta_start_y = title_y + 130  
-        duration_label = duration
-        if duration and ":" in duration and "Min" not in duration and "min" not in duration:
-            duration_label = f"{duration} Mins"
-
-        def draw_meta(y, text):
-            draw.text((info_x+1, y+1), text, fill=TEXT_SHADOW, font=meta_font)
-            draw.text((info_x,   y),   text, fill=TEXT_SOFT,  font=meta_font)
-
-        draw_meta(meta_start_y + 0 * line_gap, f"Views : {views}")
-        draw_meta(meta_start_y + 1 * line_gap, f"Duration : {duration_label}")
-        draw_meta(meta_start_y + 2 * line_gap, f"Channel : {channel}")
-
-        out = CACHE_DIR / f"{videoid}_styled.png"
-        canvas.save(out)
-
-        try:
-            os.remove(thumb_path)
-        except:
-            pass
+        async with http.get(thumburl) as resp:
+            if resp.status != 200:
+                return None
+            image_bytes = await resp.read()
 
+        await cpu_pool.run(
+            render_thumb, image_bytes, title, duration, views, channel, out
+        )
         return str(out)
 
     except Exception as e:
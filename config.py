@@ -47,6 +47,7 @@ BOT_USERNAME = os.getenv("BOT_USERNAME", "ShrutixMusicBot")
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 MONGO_DB_URI = os.getenv("MONGO_DB_URI", None)
+MONGO_SLOW_QUERY = int(os.getenv("MONGO_SLOW_QUERY", 100))
 LOG_GROUP_ID = int(os.getenv("LOG_GROUP_ID", None))
 HEROKU_APP_NAME = os.getenv("HEROKU_APP_NAME")
 HEROKU_API_KEY = os.getenv("HEROKU_API_KEY")
@@ -77,6 +78,7 @@ PRIVACY_LINK = os.getenv("PRIVACY_LINK", "https://t.me/FakeAaru")
 
 DURATION_LIMIT_MIN = int(os.getenv("DURATION_LIMIT", 300))
 PLAYLIST_FETCH_LIMIT = int(os.getenv("PLAYLIST_FETCH_LIMIT", 25))
+PLAYLIST_FETCH_WORKERS = int(os.getenv("PLAYLIST_FETCH_WORKERS", 5))
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 📦 File Size Limits (in bytes)
@@ -85,6 +87,126 @@ PLAYLIST_FETCH_LIMIT = int(os.getenv("PLAYLIST_FETCH_LIMIT", 25))
 TG_AUDIO_FILESIZE_LIMIT = int(os.getenv("TG_AUDIO_FILESIZE_LIMIT", 104857600))
 TG_VIDEO_FILESIZE_LIMIT = int(os.getenv("TG_VIDEO_FILESIZE_LIMIT", 2145386496))
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 📥 Telegram Streaming Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+TG_STREAM_BUFFER = int(os.getenv("TG_STREAM_BUFFER", 4))
+TG_STREAM_TIMEOUT = int(os.getenv("TG_STREAM_TIMEOUT", 10))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 💾 Media Cache Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+MEDIA_CACHE_LIMIT = int(os.getenv("MEDIA_CACHE_LIMIT", 5368709120))
+MEDIA_CACHE_POLICY = os.getenv("MEDIA_CACHE_POLICY", "lru").lower()
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🌐 HTTP Client Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", 100))
+HTTP_POOL_PER_HOST = int(os.getenv("HTTP_POOL_PER_HOST", 20))
+HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", 30))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", 2))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🧮 Executor Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+IO_POOL_WORKERS = int(os.getenv("IO_POOL_WORKERS", 16))
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", 0))
+LOOP_LAG_THRESHOLD = int(os.getenv("LOOP_LAG_THRESHOLD", 100))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 💾 Queue Store Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+QUEUE_PERSIST = os.getenv("QUEUE_PERSIST", "True").lower() in ("1", "true", "yes")
+QUEUE_SAVE_INTERVAL = int(os.getenv("QUEUE_SAVE_INTERVAL", 10))
+QUEUE_RESTORE_WORKERS = int(os.getenv("QUEUE_RESTORE_WORKERS", 5))
+QUEUE_RESTORE_TIMEOUT = int(os.getenv("QUEUE_RESTORE_TIMEOUT", 120))
+QUEUE_LIMIT = int(os.getenv("QUEUE_LIMIT", 100))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# ⏩ Playback Speed Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SPEED_PRERENDER = os.getenv("SPEED_PRERENDER", "True").lower() in ("1", "true", "yes")
+SPEED_RENDER_WORKERS = int(os.getenv("SPEED_RENDER_WORKERS", 1))
+SPEED_CACHE_SIZE = int(os.getenv("SPEED_CACHE_SIZE", 1024))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🎛 Player Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+PLAYER_UPDATE_INTERVAL = int(os.getenv("PLAYER_UPDATE_INTERVAL", 5))
+PLAYER_EDIT_BUDGET = int(os.getenv("PLAYER_EDIT_BUDGET", 10))
+PLAYER_LIMIT = int(os.getenv("PLAYER_LIMIT", 1))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 👥 Served Users Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SERVED_FLUSH_INTERVAL = int(os.getenv("SERVED_FLUSH_INTERVAL", 5))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 📣 Broadcast Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+BROADCAST_RATE = int(os.getenv("BROADCAST_RATE", 25))
+BROADCAST_WORKERS = int(os.getenv("BROADCAST_WORKERS", 10))
+BROADCAST_BATCH = int(os.getenv("BROADCAST_BATCH", 500))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🔨 Global Ban Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+GBAN_RATE = int(os.getenv("GBAN_RATE", 20))
+GBAN_WORKERS = int(os.getenv("GBAN_WORKERS", 5))
+GBAN_BATCH = int(os.getenv("GBAN_BATCH", 200))
+GBAN_SEEN_ONLY = os.getenv("GBAN_SEEN_ONLY", "False").lower() in ("1", "true", "yes")
+SEEN_CACHE_SIZE = int(os.getenv("SEEN_CACHE_SIZE", 100000))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 📊 Play Stats Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+STATS_FLUSH_INTERVAL = int(os.getenv("STATS_FLUSH_INTERVAL", 10))
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", 300))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🔎 Search Cache Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", 5000))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", 21600))
+SEARCH_CACHE_PERSIST = os.getenv("SEARCH_CACHE_PERSIST", "False").lower() in ("1", "true", "yes")
+SLIDER_SESSION_TTL = int(os.getenv("SLIDER_SESSION_TTL", 600))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🖌️ Thumbnail Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+THUMB_FORMAT = os.getenv("THUMB_FORMAT", "jpeg").lower()
+THUMB_CACHE_LIMIT = int(os.getenv("THUMB_CACHE_LIMIT", 500))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# ⏭️ Prefetch Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+PREFETCH_DEPTH = int(os.getenv("PREFETCH_DEPTH", 1))
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", 3))
+PREFETCH_BANDWIDTH = int(os.getenv("PREFETCH_BANDWIDTH", 0))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🔒 Force Subscribe Settings
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+FSUB_MEMBER_TTL = int(os.getenv("FSUB_MEMBER_TTL", 600))
+FSUB_NONMEMBER_TTL = int(os.getenv("FSUB_NONMEMBER_TTL", 60))
+FSUB_CACHE_SIZE = int(os.getenv("FSUB_CACHE_SIZE", 100000))
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 🎧 Spotify Developer Credentials
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -96,11 +218,21 @@ SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET", None)
 # 🧵 Session Strings (Pyrogram V2)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-STRING1 = os.getenv("STRING_SESSION", None)
-STRING2 = os.getenv("STRING_SESSION2", None)
-STRING3 = os.getenv("STRING_SESSION3", None)
-STRING4 = os.getenv("STRING_SESSION4", None)
-STRING5 = os.getenv("STRING_SESSION5", None)
+STRING_SESSIONS = {
+    int(key[len("STRING_SESSION") :]): value
+    for key, value in os.environ.items()
+    if re.fullmatch(r"STRING_SESSION\d+", key) and value
+}
+
+if os.getenv("STRING_SESSION"):
+    if 1 in STRING_SESSIONS:
+        print(
+            "[WARNING] - STRING_SESSION and STRING_SESSION1 are both set, ignoring STRING_SESSION."
+        )
+    else:
+        STRING_SESSIONS[1] = os.getenv("STRING_SESSION")
+
+ASSISTANT_REBALANCE_GAP = int(os.getenv("ASSISTANT_REBALANCE_GAP", 5))
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # ⚙️ Runtime Configurations
@@ -133,7 +265,6 @@ BANNED_USERS = filters.user()
 adminlist = {}
 lyrical = {}
 votemode = {}
-autoclean = []
 confirmer = {}
 
 TEMP_DB_FOLDER = "tempdb"
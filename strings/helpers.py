@@ -63,6 +63,9 @@ HELP_3 = """
 <b>-wfuser</b> : sᴘᴇᴄɪᴀʟ ʙʀᴏᴀᴅᴄᴀsᴛ ᴍᴏᴅᴇ ғᴏʀ ᴜsᴇʀs (ᴡᴏʀᴋs ᴡɪᴛʜ ʀᴇᴘʟɪᴇᴅ ᴍᴇssᴀɢᴇs).
 
 <b>ɴᴏᴛᴇ:</b> -wfchat and -wfuser modes require replying to a message.
+
+/bstatus : sʜᴏᴡ ᴘʀᴏɢʀᴇss, ғᴀɪʟᴜʀᴇs ᴀɴᴅ sᴘᴇᴇᴅ ᴏғ ʀᴜɴɴɪɴɢ ʙʀᴏᴀᴅᴄᴀsᴛs.
+/bcancel [ᴊᴏʙ ɪᴅ] : ᴄᴀɴᴄᴇʟ ᴀ ʀᴜɴɴɪɴɢ ʙʀᴏᴀᴅᴄᴀsᴛ.
 """
 
 HELP_4 = """<u><b>ᴄʜᴀᴛ ʙʟᴀᴄᴋʟɪsᴛ ғᴇᴀᴛᴜʀᴇ :</b></u> [ᴏɴʟʏ ғᴏʀ sᴜᴅᴏᴇʀs]
@@ -102,6 +105,7 @@ HELP_7 = """
 /gban [ᴜsᴇʀɴᴀᴍᴇ ᴏʀ ʀᴇᴩʟʏ ᴛᴏ ᴀ ᴜsᴇʀ] : ɢʟᴏʙᴀʟʟʏ ʙᴀɴs ᴛʜᴇ ᴄʜᴜᴛɪʏᴀ ғʀᴏᴍ ᴀʟʟ ᴛʜᴇ sᴇʀᴠᴇᴅ ᴄʜᴀᴛs ᴀɴᴅ ʙʟᴀᴄᴋʟɪsᴛ ʜɪᴍ ғʀᴏᴍ ᴜsɪɴɢ ᴛʜᴇ ʙᴏᴛ.
 /ungban [ᴜsᴇʀɴᴀᴍᴇ ᴏʀ ʀᴇᴩʟʏ ᴛᴏ ᴀ ᴜsᴇʀ] : ɢʟᴏʙᴀʟʟʏ ᴜɴʙᴀɴs ᴛʜᴇ ɢʟᴏʙᴀʟʟʏ ʙᴀɴɴᴇᴅ ᴜsᴇʀ.
 /gbannedusers : sʜᴏᴡs ᴛʜᴇ ʟɪsᴛ ᴏғ ɢʟᴏʙᴀʟʟʏ ʙᴀɴɴᴇᴅ ᴜsᴇʀs.
+/gbanstatus : sʜᴏᴡs ᴛʜᴇ ᴘʀᴏɢʀᴇss ᴏғ ʀᴜɴɴɪɴɢ ɢʙᴀɴ/ᴜɴɢʙᴀɴ ᴊᴏʙs.
 """
 
 HELP_8 = """
@@ -121,6 +125,10 @@ HELP_9 = """
 /logger [ᴇɴᴀʙʟᴇ/ᴅɪsᴀʙʟᴇ] : ʙᴏᴛ ᴡɪʟʟ sᴛᴀʀᴛ ʟᴏɢɢɪɴɢ ᴛʜᴇ ᴀᴄᴛɪᴠɪᴛɪᴇs ʜᴀᴩᴩᴇɴ ᴏɴ ʙᴏᴛ.
 
 /maintenance [ᴇɴᴀʙʟᴇ/ᴅɪsᴀʙʟᴇ] : ᴇɴᴀʙʟᴇ ᴏʀ ᴅɪsᴀʙʟᴇ ᴛʜᴇ ᴍᴀɪɴᴛᴇɴᴀɴᴄᴇ ᴍᴏᴅᴇ ᴏғ ʏᴏᴜʀ ʙᴏᴛ.
+
+/assistants : sʜᴏᴡ ᴛʜᴇ ᴄᴜʀʀᴇɴᴛ ʟᴏᴀᴅ ᴏғ ᴇᴀᴄʜ ᴀssɪsᴛᴀɴᴛ.
+
+/dbstats : sʜᴏᴡ ᴅᴏᴄᴜᴍᴇɴᴛ ᴄᴏᴜɴᴛs, ɪɴᴅᴇx ᴜsᴀɢᴇ ᴀɴᴅ ǫᴜᴇʀʏ ʟᴀᴛᴇɴᴄʏ ᴏғ ᴇᴀᴄʜ ᴄᴏʟʟᴇᴄᴛɪᴏɴ.
 """
 
 HELP_10 = """